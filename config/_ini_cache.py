@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""_ini_cache.py
+
+devices.ini 파싱 결과(ConfigParser) 캐시.
+
+ - plc_config / serial_config 가 같은 ini를 여러 번 읽어도 실제 파싱은 1번만 한다.
+ - 키에 파일 mtime을 포함하므로, Config 창에서 저장(파일 수정)하면 자동으로 다시 읽는다.
+ - DeviceConfig: 섹션별로 변환이 끝난 dataclass까지 캐시(반복 load_* 호출은 dict 조회 수준)
+ - 값 검증(parity/baudrate/...)도 변환 시점에 1번만 → 잘못된 ini는 시작/저장 직후 바로 드러난다.
+"""
+
+from __future__ import annotations
+
+from configparser import ConfigParser
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+class ConfigValidationError(ValueError):
+    """devices.ini 값 오류(어느 섹션/키인지 함께 보관).
+
+    ValueError를 상속하므로 기존 except ValueError/Exception 처리는 그대로 동작한다.
+    """
+
+    def __init__(self, section: str, key: str, message: str):
+        super().__init__(f"[{section}] {key}: {message}")
+        self.section = section
+        self.key = key
+
+
+# 시리얼 라인 공통 허용값(pyserial 기준)
+_PARITIES = frozenset("NEOMS")
+_BYTESIZES = frozenset((5, 6, 7, 8))
+_STOPBITS = frozenset((1, 2))
+
+
+def _parse_schema(
+    section: str,
+    d: Mapping[str, str],
+    schema: tuple[tuple[str, Callable[[str], Any], Any], ...],
+    normalize: Mapping[str, Callable[[str], str]],
+) -> dict[str, Any]:
+    """(key, cast, default) 표를 한 번 순회해서 kwargs dict를 만든다.
+
+    - 키가 없거나 값이 비어있으면 기본값
+    - 변환 실패는 ConfigValidationError(섹션/키 포함)로 올린다
+    """
+    kv: dict[str, Any] = {}
+    for key, cast, default in schema:
+        v = d.get(key)
+        if not v:
+            kv[key] = default
+            continue
+        try:
+            v = cast(v)
+        except ValueError as e:
+            raise ConfigValidationError(section, key, str(e)) from None
+        norm = normalize.get(key)
+        kv[key] = norm(v) if norm is not None else v
+    return kv
+
+
+def _check_line(section: str, kv: Mapping[str, Any]) -> None:
+    """baudrate/bytesize/parity/stopbits/timeout 공통 검증."""
+    if kv["baudrate"] <= 0:
+        raise ConfigValidationError(section, "baudrate", f"must be > 0 (now={kv['baudrate']})")
+    if kv["bytesize"] not in _BYTESIZES:
+        raise ConfigValidationError(section, "bytesize", f"must be 5~8 (now={kv['bytesize']})")
+    if kv["parity"] not in _PARITIES:
+        raise ConfigValidationError(section, "parity", f"must be one of N/E/O/M/S (now={kv['parity']!r})")
+    if kv["stopbits"] not in _STOPBITS:
+        raise ConfigValidationError(section, "stopbits", f"must be 1 or 2 (now={kv['stopbits']})")
+    if kv["timeout_s"] < 0:
+        raise ConfigValidationError(section, "timeout_s", f"must be >= 0 (now={kv['timeout_s']})")
+
+
+@lru_cache(maxsize=8)
+def _load_cfg(path: str, mtime: float) -> ConfigParser:
+    """path(절대경로) + mtime 기준으로 파싱된 ConfigParser를 캐시한다.
+
+    ⚠️ 반환된 객체는 여러 호출자가 공유하므로 읽기 전용으로만 사용할 것.
+    """
+    cfg = ConfigParser()
+    cfg.read(path, encoding="utf-8")
+    return cfg
+
+
+def _section_dict(cfg: ConfigParser, section: str) -> dict[str, str]:
+    """섹션 전체를 한 번에 {key: value(strip)} dict로 꺼낸다.
+
+    key별로 has_option()/get() 을 반복 호출하는 대신 dict.get() 한 번으로 끝내기 위함.
+    """
+    return {k: v.strip() for k, v in cfg.items(section)}
+
+
+class DeviceConfig:
+    """devices.ini 한 파일의 '타입 변환이 끝난' 설정 캐시.
+
+    - 섹션별 dataclass(PLCSettings / SerialSettings)를 한 번 만들어 두고 재사용한다.
+    - 파일 mtime이 바뀌면(저장) 새 인스턴스로 교체되므로 오래된 값이 남지 않는다.
+    - 텍스트(ini) ↔ dataclass 변환은 읽기/저장 시점에만 일어난다.
+    """
+
+    _instances: dict[str, "DeviceConfig"] = {}
+
+    def __init__(self, path: str, mtime: float):
+        self.path = path
+        self.mtime = mtime
+        self.cfg = _load_cfg(path, mtime)
+        self._sections: dict[tuple[str, object], object] = {}
+
+    @classmethod
+    def instance(cls, ini_path: str | Path) -> "DeviceConfig":
+        p = Path(ini_path).resolve()
+        key = str(p)
+        mtime = p.stat().st_mtime
+
+        inst = cls._instances.get(key)
+        if inst is None or inst.mtime != mtime:
+            inst = cls(key, mtime)
+            cls._instances[key] = inst
+        return inst
+
+    @classmethod
+    def invalidate(cls, ini_path: str | Path) -> None:
+        """ini를 직접 저장한 뒤 호출(mtime 해상도가 낮은 파일시스템 대비)."""
+        cls._instances.pop(str(Path(ini_path).resolve()), None)
+        _load_cfg.cache_clear()
+
+    def section(self, name: str, build: Callable[[ConfigParser, str], T]) -> T:
+        """name 섹션을 build(cfg, name)으로 변환한 결과를 캐시해서 반환.
+
+        build가 예외를 던지면(섹션 없음/값 오류) 캐시하지 않고 그대로 올린다.
+        """
+        key = (name, build)
+        try:
+            return self._sections[key]  # type: ignore[return-value]
+        except KeyError:
+            pass
+        obj = build(self.cfg, name)
+        self._sections[key] = obj
+        return obj
@@ -18,9 +18,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from configparser import ConfigParser
 from pathlib import Path
+from typing import Any, Callable
 
+from config._ini_cache import (
+    ConfigValidationError,
+    DeviceConfig,
+    _check_line,
+    _parse_schema,
+    _section_dict,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PLCSettings:
     # Modbus-RTU (RS-232)
     port: str = "COM5"
@@ -49,22 +58,37 @@ class PLCSettings:
     dac_current_max_ma: float = 20.0
 
 
-def _get_str(cfg: ConfigParser, section: str, key: str, default: str) -> str:
-    if cfg.has_option(section, key):
-        return cfg.get(section, key).strip()
-    return default
+# 기본값은 인스턴스 하나에서 읽는다(클래스 속성 조회 반복 방지)
+_DEF_PLC = PLCSettings()
 
 
-def _get_int(cfg: ConfigParser, section: str, key: str, default: int) -> int:
-    if cfg.has_option(section, key):
-        return cfg.getint(section, key)
-    return default
+# (ini key, 변환 함수, 기본값) — 키마다 분기 코드를 쓰지 않고 이 표를 한 번 순회한다
+_PLC_SCHEMA: tuple[tuple[str, Callable[[str], Any], Any], ...] = (
+    ("port", str, _DEF_PLC.port),
+    ("method", str, _DEF_PLC.method),
+    ("baudrate", int, _DEF_PLC.baudrate),
+    ("bytesize", int, _DEF_PLC.bytesize),
+    ("parity", str, _DEF_PLC.parity),
+    ("stopbits", int, _DEF_PLC.stopbits),
+    ("unit", int, _DEF_PLC.unit),
+    ("timeout_s", float, _DEF_PLC.timeout_s),
+    ("poll_interval_s", float, _DEF_PLC.poll_interval_s),
+    ("reconnect_interval_s", float, _DEF_PLC.reconnect_interval_s),
+    ("pulse_ms", int, _DEF_PLC.pulse_ms),
+    ("door_move_time_s", float, _DEF_PLC.door_move_time_s),
 
+    # ✅ DAC (4~20mA)
+    ("dac_full_scale_code", int, _DEF_PLC.dac_full_scale_code),
+    ("dac_offset_code", int, _DEF_PLC.dac_offset_code),
+    ("dac_current_min_ma", float, _DEF_PLC.dac_current_min_ma),
+    ("dac_current_max_ma", float, _DEF_PLC.dac_current_max_ma),
+)
 
-def _get_float(cfg: ConfigParser, section: str, key: str, default: float) -> float:
-    if cfg.has_option(section, key):
-        return cfg.getfloat(section, key)
-    return default
+# 변환 후 대소문자 정규화가 필요한 키
+_NORMALIZE: dict[str, Callable[[str], str]] = {
+    "method": str.lower,
+    "parity": str.upper,
+}
 
 
 def load_plc_settings(ini_path: str | Path, section: str = "plc") -> PLCSettings:
@@ -72,40 +96,32 @@ def load_plc_settings(ini_path: str | Path, section: str = "plc") -> PLCSettings
 
     - [plc] 섹션이 없으면 기본값(PLCSettings 기본값)으로 반환
     - ip가 비어있어도 기본값 사용
+    - 같은 파일(mtime 동일)을 다시 읽으면 캐시된 PLCSettings를 그대로 반환
+    - 값이 잘못되면(parity/baudrate/unit 등) ConfigValidationError(섹션/키 포함)
     """
     ini_path = Path(ini_path)
     if not ini_path.exists():
         # ini 자체가 없으면 개발 단계에서는 기본값으로라도 뜨게
         return PLCSettings()
 
-    cfg = ConfigParser()
-    cfg.read(ini_path, encoding="utf-8")
+    return DeviceConfig.instance(ini_path).section(section, _build_plc_settings)
+
 
+def _build_plc_settings(cfg: ConfigParser, section: str) -> PLCSettings:
     if not cfg.has_section(section):
         return PLCSettings()
 
-    port = _get_str(cfg, section, "port", PLCSettings.port) or PLCSettings.port
-    method = (_get_str(cfg, section, "method", PLCSettings.method) or PLCSettings.method).lower()
-    parity = (_get_str(cfg, section, "parity", PLCSettings.parity) or PLCSettings.parity).upper()
-
-    return PLCSettings(
-        port=port,
-        method=method,
-        baudrate=_get_int(cfg, section, "baudrate", PLCSettings.baudrate),
-        bytesize=_get_int(cfg, section, "bytesize", PLCSettings.bytesize),
-        parity=parity,
-        stopbits=_get_int(cfg, section, "stopbits", PLCSettings.stopbits),
-        unit=_get_int(cfg, section, "unit", PLCSettings.unit),
-        timeout_s=_get_float(cfg, section, "timeout_s", PLCSettings.timeout_s),
-        poll_interval_s=_get_float(cfg, section, "poll_interval_s", PLCSettings.poll_interval_s),
-        reconnect_interval_s=_get_float(cfg, section, "reconnect_interval_s", PLCSettings.reconnect_interval_s),
-        pulse_ms=_get_int(cfg, section, "pulse_ms", PLCSettings.pulse_ms),
-        door_move_time_s=_get_float(cfg, section, "door_move_time_s", PLCSettings.door_move_time_s),
-
-        # ✅ DAC (4~20mA)
-        dac_full_scale_code=_get_int(cfg, section, "dac_full_scale_code", PLCSettings.dac_full_scale_code),
-        dac_offset_code=_get_int(cfg, section, "dac_offset_code", PLCSettings.dac_offset_code),
-        dac_current_min_ma=_get_float(cfg, section, "dac_current_min_ma", PLCSettings.dac_current_min_ma),
-        dac_current_max_ma=_get_float(cfg, section, "dac_current_max_ma", PLCSettings.dac_current_max_ma),
-    )
+    d = _section_dict(cfg, section)
+
+    kv = _parse_schema(section, d, _PLC_SCHEMA, _NORMALIZE)
+
+    # 값 검증(결과가 DeviceConfig에 캐시되므로 파일이 바뀔 때만 1번 수행)
+    _check_line(section, kv)
+    if kv["method"] != "rtu":
+        raise ConfigValidationError(section, "method", f"only 'rtu' is supported (now={kv['method']!r})")
+    if not 0 <= kv["unit"] <= 247:
+        raise ConfigValidationError(section, "unit", f"must be 0~247 (now={kv['unit']})")
+    if kv["poll_interval_s"] < 0:
+        raise ConfigValidationError(section, "poll_interval_s", f"must be >= 0 (now={kv['poll_interval_s']})")
 
+    return PLCSettings(**kv)
@@ -4,10 +4,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
+from config._ini_cache import (
+    ConfigValidationError,
+    DeviceConfig,
+    _check_line,
+    _parse_schema,
+    _section_dict,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SerialSettings:
     port: str
     baudrate: int = 9600
@@ -23,28 +31,39 @@ class SerialSettings:
     eom: Optional[str] = None  # "CR" or "CRLF"
 
 
-def _get_bool(cfg: ConfigParser, section: str, key: str, default: bool) -> bool:
-    if cfg.has_option(section, key):
-        return cfg.getboolean(section, key)
-    return default
+# 기본값은 인스턴스 하나에서 읽는다(port는 필수값이라 기본값 없음)
+_DEF_SERIAL = SerialSettings(port="")
 
 
-def _get_int(cfg: ConfigParser, section: str, key: str, default: int) -> int:
-    if cfg.has_option(section, key):
-        return cfg.getint(section, key)
-    return default
+def _to_bool(v: str) -> bool:
+    # ValueError → _parse_schema에서 ConfigValidationError(섹션/키 포함)로 변환
+    try:
+        return ConfigParser.BOOLEAN_STATES[v.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {v}") from None
 
 
-def _get_float(cfg: ConfigParser, section: str, key: str, default: float) -> float:
-    if cfg.has_option(section, key):
-        return cfg.getfloat(section, key)
-    return default
+# (ini key, 변환 함수, 기본값) — port는 필수값이라 표에서 빼고 따로 검사
+_SERIAL_SCHEMA: tuple[tuple[str, Callable[[str], Any], Any], ...] = (
+    ("baudrate", int, _DEF_SERIAL.baudrate),
+    ("bytesize", int, _DEF_SERIAL.bytesize),
+    ("parity", str, _DEF_SERIAL.parity),
+    ("stopbits", int, _DEF_SERIAL.stopbits),
+    ("timeout_s", float, _DEF_SERIAL.timeout_s),
+    ("write_timeout_s", float, _DEF_SERIAL.write_timeout_s),
+    ("rtscts", _to_bool, _DEF_SERIAL.rtscts),
+    ("dsrdtr", _to_bool, _DEF_SERIAL.dsrdtr),
+    ("eom", str, _DEF_SERIAL.eom),
+)
 
+# ACS2000 EOM 허용값(None = 미지정 → CR)
+_EOMS = frozenset((None, "CR", "CRLF"))
 
-def _get_str(cfg: ConfigParser, section: str, key: str, default: str) -> str:
-    if cfg.has_option(section, key):
-        return cfg.get(section, key).strip()
-    return default
+# 변환 후 대소문자 정규화가 필요한 키
+_NORMALIZE: dict[str, Callable[[str], str]] = {
+    "parity": str.upper,
+    "eom": str.upper,
+}
 
 
 def load_settings(ini_path: str | Path, section: str) -> SerialSettings:
@@ -52,26 +71,25 @@ def load_settings(ini_path: str | Path, section: str) -> SerialSettings:
     if not ini_path.exists():
         raise FileNotFoundError(f"devices ini not found: {ini_path}")
 
-    cfg = ConfigParser()
-    cfg.read(ini_path, encoding="utf-8")
+    return DeviceConfig.instance(ini_path).section(section, _build_settings)
+
 
+def _build_settings(cfg: ConfigParser, section: str) -> SerialSettings:
     if not cfg.has_section(section):
         raise KeyError(f"missing section in ini: [{section}]")
 
-    port = _get_str(cfg, section, "port", "")
+    d = _section_dict(cfg, section)
+
+    port = d.get("port", "")
     if not port:
-        raise ValueError(f"[{section}] port is empty")
-
-    settings = SerialSettings(
-        port=port,
-        baudrate=_get_int(cfg, section, "baudrate", 9600),
-        bytesize=_get_int(cfg, section, "bytesize", 8),
-        parity=_get_str(cfg, section, "parity", "N").upper(),
-        stopbits=_get_int(cfg, section, "stopbits", 1),
-        timeout_s=_get_float(cfg, section, "timeout_s", 0.5),
-        write_timeout_s=_get_float(cfg, section, "write_timeout_s", 0.5),
-        rtscts=_get_bool(cfg, section, "rtscts", False),
-        dsrdtr=_get_bool(cfg, section, "dsrdtr", False),
-        eom=_get_str(cfg, section, "eom", "").upper() or None,
-    )
-    return settings
+        raise ConfigValidationError(section, "port", "port is empty")
+
+    kv = _parse_schema(section, d, _SERIAL_SCHEMA, _NORMALIZE)
+    kv["port"] = port
+
+    # 값 검증(결과가 DeviceConfig에 캐시되므로 파일이 바뀔 때만 1번 수행)
+    _check_line(section, kv)
+    if kv["eom"] not in _EOMS:
+        raise ConfigValidationError(section, "eom", f"must be CR or CRLF (now={kv['eom']!r})")
+
+    return SerialSettings(**kv)
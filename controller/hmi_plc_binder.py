@@ -19,13 +19,14 @@ from __future__ import annotations
 import time
 import asyncio
 import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List
+from functools import partial
+from typing import Deque, Dict, Optional, Tuple, List
 
-from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import Qt, QObject, QThread, Signal, QSignalBlocker, QTimer
 
-from devices.plc import AsyncPLC
+from devices.plc import AsyncPLC, PLC_COIL_AIR_SW, PLC_COIL_R_P_SW
 from config.plc_config import PLCSettings
 
 
@@ -36,7 +37,29 @@ from config.plc_config import PLCSettings
 # ------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+# PLC 코일 블록 레이아웃(읽기 순서 그대로)
+#  - block0: coil 0~12, block1: coil 32~35
+_BLOCK0_NAMES: Tuple[str, ...] = (
+    "RP_SW", "RV_SW", "FV_SW", "MV_SW", "VV_SW", "TMP_SW",
+    "SHUTTER_1_SW", "SHUTTER_2_SW", "MAIN_SHUTTER_SW",
+    "POWER_1_SW", "POWER_2_SW", "FTM_SW", "DOOR_SW",
+)
+_BLOCK1_NAMES: Tuple[str, ...] = ("AIR_SW", "WATER_SW", "GAS_1_SW", "GAS_2_SW")
+
+
+_BLOCK_NAMES: Tuple[str, ...] = _BLOCK0_NAMES + _BLOCK1_NAMES
+
+
+def _decode_blocks(b0: List[bool], b1: List[bool]) -> Dict[str, bool]:
+    """(block0, block1) → {코일명: bool}. 이름 순서 = 블록 읽기 순서."""
+    return dict(zip(_BLOCK_NAMES, b0 + b1))
+
+
+# ALL STOP 커맨드(워커에서 block0 전체 OFF 한 번으로 확장)
+_ALL_OFF = "__ALL_OFF__"
+
+
+@dataclass(frozen=True, slots=True)
 class ButtonBinding:
     widget_name: str
     coil_name: str
@@ -57,13 +80,12 @@ class PlcWorker(QThread):
         # stop 플래그(스레드 종료 요청)
         self._stop_evt = threading.Event()
 
-        # 스레드 내부 asyncio loop와 command queue
+        # 스레드 내부 asyncio loop + command deque
+        #  - deque.append/popleft는 스레드 간에도 원자적이라 별도 lock 불필요
+        #  - start() 이전에 들어온 커맨드도 deque에 그대로 쌓였다가 첫 폴링에서 처리됨
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._cmd_q: Optional[asyncio.Queue] = None
-
-        # start() 이전에 enqueue가 들어오면 잠깐 보관
-        self._pending_cmds: List[Tuple[str, bool, bool]] = []
-        self._pending_lock = threading.Lock()
+        self._cmd_dq: Deque[Tuple[str, bool, bool]] = deque()
+        self._cmd_wake: Optional[asyncio.Event] = None
 
     # -------------------------------
     # public API (메인 스레드에서 호출)
@@ -71,24 +93,22 @@ class PlcWorker(QThread):
     def stop(self) -> None:
         """워커 중지 요청."""
         self._stop_evt.set()
-        if self._loop:
-            # sleep 중이어도 빨리 깨어나도록 빈 콜백 한 번
-            try:
-                self._loop.call_soon_threadsafe(lambda: None)
-            except Exception:
-                pass
+        self._wake()
 
     def enqueue_write(self, coil_name: str, on: bool, momentary: bool = False) -> None:
         """PLC에 coil write 요청을 큐에 넣는다."""
-        if self._loop and self._cmd_q:
-            asyncio.run_coroutine_threadsafe(
-                self._cmd_q.put((coil_name, bool(on), bool(momentary))),
-                self._loop,
-            )
-        else:
-            # 아직 run() 시작 전이면 보관
-            with self._pending_lock:
-                self._pending_cmds.append((coil_name, bool(on), bool(momentary)))
+        self._cmd_dq.append((coil_name, bool(on), bool(momentary)))
+        self._wake()
+
+    def _wake(self) -> None:
+        """폴링 대기 중인 워커를 깨운다(메인 스레드에서 호출)."""
+        loop, evt = self._loop, self._cmd_wake
+        if loop is None or evt is None:
+            return  # 아직 run() 시작 전 → 첫 폴링에서 처리
+        try:
+            loop.call_soon_threadsafe(evt.set)
+        except RuntimeError:
+            pass  # loop 종료됨
 
     # -------------------------------
     # QThread entry
@@ -97,14 +117,8 @@ class PlcWorker(QThread):
         """스레드 진입점: asyncio loop 생성 후 코루틴 실행."""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self._cmd_wake = asyncio.Event()
         self._loop = loop
-        self._cmd_q = asyncio.Queue()
-
-        # start 전에 들어온 커맨드 flush
-        with self._pending_lock:
-            for cmd in self._pending_cmds:
-                loop.call_soon_threadsafe(self._cmd_q.put_nowait, cmd)
-            self._pending_cmds.clear()
 
         try:
             loop.run_until_complete(self._main(loop))
@@ -152,18 +166,31 @@ class PlcWorker(QThread):
 
         await connect_until_ok()
 
+        cmd_dq = self._cmd_dq
+        wake = self._cmd_wake
+        poll_s = max(0.0, self._settings.poll_interval_s)
+
         # 폴링 루프
         while not self._stop_evt.is_set():
             try:
-                # 1) 명령 처리 (큐에 있으면 즉시 처리)
-                await self._drain_commands(plc)
+                # 1) 명령 처리 — fast path: 쌓인 게 없으면(대부분의 tick) 호출 자체를 생략
+                if cmd_dq:
+                    await self._drain_commands(plc)
 
                 # 2) 상태 읽기
                 states = await self._read_hmi_states(plc)
                 self.sig_states.emit(states)
 
-                # 3) 다음 폴링까지 대기(대기 중에도 커맨드가 오면 빨리 처리)
-                await self._sleep_with_command_break(plc, self._settings.poll_interval_s)
+                # 3) 다음 폴링까지 대기(커맨드가 오면 즉시 깨어나서 1)부터)
+                #  - wait_for는 tick마다 Task + timeout 래퍼를 만들므로,
+                #    timer 하나(call_later)로 같은 Event를 set 해서 깨운다.
+                if not cmd_dq:
+                    timer = loop.call_later(poll_s, wake.set)
+                    try:
+                        await wake.wait()
+                    finally:
+                        timer.cancel()
+                    wake.clear()  # deque가 기준이므로 여기서 clear해도 커맨드 유실 없음
 
             except Exception as e:
                 # 통신 오류 → 연결 재시도
@@ -183,68 +210,54 @@ class PlcWorker(QThread):
         self.sig_connected.emit(False)
 
     async def _drain_commands(self, plc: AsyncPLC) -> None:
-        if not self._cmd_q:
+        """쌓인 커맨드를 한 번에 꺼내서 처리.
+
+        - 같은 코일에 대한 요청은 마지막 값만 전송(last write wins)
+        - ALL STOP(_ALL_OFF)은 coil 0~12 OFF를 FC15 한 프레임으로 전송하고,
+          그 이전에 쌓인 개별 요청은 버린다.
+        - 나머지 유지형 요청은 write_switches 한 번(락 1회, 연속 주소는 FC15로 합침)
+        """
+        # clear 후에 꺼내야 그 사이 들어온 커맨드의 wake를 놓치지 않음
+        if self._cmd_wake is not None:
+            self._cmd_wake.clear()
+
+        dq = self._cmd_dq
+        cmds: List[Tuple[str, bool, bool]] = []
+        while dq:
+            cmds.append(dq.popleft())
+        if not cmds:
             return
 
-        # 큐가 비면 빠르게 빠져나옴
-        while not self._cmd_q.empty():
-            coil_name, on, momentary = self._cmd_q.get_nowait()
-            await plc.write_switch(coil_name, on, momentary=momentary)
+        all_off = False
+        pending: Dict[str, Tuple[bool, bool]] = {}
+        for coil_name, on, momentary in cmds:
+            if coil_name == _ALL_OFF:
+                all_off = True
+                pending.clear()
+                continue
+            pending.pop(coil_name, None)  # 순서도 마지막 요청 기준으로
+            pending[coil_name] = (on, momentary)
 
-    async def _sleep_with_command_break(self, plc: AsyncPLC, seconds: float) -> None:
-        """seconds 동안 자되, 그 사이 커맨드가 들어오면 즉시 처리하고 계속 대기."""
-        if not self._cmd_q or seconds <= 0:
-            await asyncio.sleep(max(0.0, seconds))
-            return
+        if all_off:
+            await plc.write_coils_block(PLC_COIL_R_P_SW, [False] * len(_BLOCK0_NAMES))
 
-        try:
-            # 커맨드 하나가 오거나, timeout이 되거나
-            coil_name, on, momentary = await asyncio.wait_for(self._cmd_q.get(), timeout=seconds)
-            await plc.write_switch(coil_name, on, momentary=momentary)
-            # 추가로 쌓인 커맨드도 같이 처리
-            await self._drain_commands(plc)
-        except asyncio.TimeoutError:
-            return
+        # 유지형(on/off) 요청은 write_switches로 묶어서(연속 주소 → FC15 1프레임), 모멘터리만 개별 펄스
+        latched = {name: on for name, (on, momentary) in pending.items() if not momentary}
+        if latched:
+            await plc.write_switches(latched)
+        for coil_name, (on, momentary) in pending.items():
+            if momentary:
+                await plc.write_switch(coil_name, on, momentary=True)
 
     async def _read_hmi_states(self, plc: AsyncPLC) -> Dict[str, bool]:
         """HMI에서 필요한 코일만 읽어서 dict로 반환."""
 
         # 현재 HMI가 쓰는 코일은 0~12, 32~35에 몰려있음.
         # => 블록으로 읽으면 Modbus 요청 횟수가 확 줄어듭니다.
-        block0 = await plc.read_coils_block(0, 13)   # 0~12
-        block1 = await plc.read_coils_block(32, 4)   # 32~35
-
-        out: Dict[str, bool] = {}
-
-        # 0~12
-        out.update(
-            {
-                "RP_SW": bool(block0[0]),
-                "RV_SW": bool(block0[1]),
-                "FV_SW": bool(block0[2]),
-                "MV_SW": bool(block0[3]),
-                "VV_SW": bool(block0[4]),
-                "TMP_SW": bool(block0[5]),
-                "SHUTTER_1_SW": bool(block0[6]),
-                "SHUTTER_2_SW": bool(block0[7]),
-                "MAIN_SHUTTER_SW": bool(block0[8]),
-                "POWER_1_SW": bool(block0[9]),
-                "POWER_2_SW": bool(block0[10]),
-                "FTM_SW": bool(block0[11]),
-                "DOOR_SW": bool(block0[12]),
-            }
-        )
+        block0 = await plc.read_coils_block(PLC_COIL_R_P_SW, len(_BLOCK0_NAMES))   # 0~12
+        block1 = await plc.read_coils_block(PLC_COIL_AIR_SW, len(_BLOCK1_NAMES))   # 32~35
 
-        # 32~35
-        out.update(
-            {
-                "AIR_SW": bool(block1[0]),
-                "WATER_SW": bool(block1[1]),
-                "GAS_1_SW": bool(block1[2]),
-                "GAS_2_SW": bool(block1[3]),
-            }
-        )
-        return out
+        return _decode_blocks(block0, block1)
 
 
 class HmiPlcBinder(QObject):
@@ -282,15 +295,34 @@ class HmiPlcBinder(QObject):
 
         self._last_states: Dict[str, bool] = {}
 
+        # 버튼 위젯/indicator setter는 한 번만 찾아둔다(폴링마다 getattr 반복 방지)
+        self._btn_widgets: Dict[ButtonBinding, object] = {
+            b: w for b in self.BUTTONS if (w := getattr(self.ui, b.widget_name, None)) is not None
+        }
+        self._set_indicator = getattr(self.ui, "set_indicator_state", None)
+        self._indicator_items: Tuple[Tuple[str, str], ...] = tuple(self.INDICATORS.items())
+
+        # 사용자가 클릭해서 PLC 상태와 어긋났을 수 있는 코일(다음 폴링에서 무조건 재동기화)
+        self._dirty_coils: set[str] = set()
+
         # 연결 상태(인터락 메시지용)
         self._connected: bool = False
 
         # Door 이동(열림/닫힘) 중 인터락용 busy window
-        self._door_busy_until: float = 0.0
+        self._door_busy_until_ns: int = 0
         self._door_busy_timer = QTimer(self)
         self._door_busy_timer.setSingleShot(True)
         self._door_busy_timer.timeout.connect(self._end_door_busy)
 
+        # 상태/로그 텍스트는 한 프레임(16ms) 동안 모았다가 마지막 값만 한 번 그린다
+        # (ALL STOP 등으로 연속 호출돼도 setText/repaint는 1회)
+        self._pending_status: Optional[str] = None
+        self._pending_log: Optional[str] = None
+        self._text_flush_timer = QTimer(self)
+        self._text_flush_timer.setSingleShot(True)
+        self._text_flush_timer.setInterval(16)
+        self._text_flush_timer.timeout.connect(self._flush_hmi_text)
+
         # PLC worker (Config 저장 후 재적용을 위해 reset 가능)
         self._worker: PlcWorker | None = None
         self._reset_worker(settings)
@@ -339,19 +371,15 @@ class HmiPlcBinder(QObject):
     # --------------------------------------------------
     def _wire_ui(self) -> None:
         # 1) 각 버튼: toggled -> PLC write
-        for b in self.BUTTONS:
-            w = getattr(self.ui, b.widget_name, None)
-            if w is None:
-                continue
-
+        for b, w in self._btn_widgets.items():
             # checkable이 아니면 강제로(디자이너에서 이미 checkable로 설정해둔 상태)
             try:
                 w.setCheckable(True)
             except Exception:
                 pass
 
-            # late-binding 이슈 방지: default arg로 캡처
-            w.toggled.connect(lambda on, bb=b: self._on_button_toggled(bb, on))
+            # partial로 binding 고정(late-binding 방지, 버튼마다 lambda 클로저를 만들지 않음)
+            w.toggled.connect(partial(self._on_button_toggled, b))
 
         # 2) All Stop
         all_stop = getattr(self.ui, "allstopBtn", None)
@@ -369,11 +397,13 @@ class HmiPlcBinder(QObject):
             - 경고창 표시
             - Main Shutter OFF 명령은 PLC에 전송하지 않음
         """
+        on = bool(on)
+        self._dirty_coils.add(binding.coil_name)
 
         # PLC 미연결 상태에서 조작이 들어오면 → 전송 금지 + UI 원복
         if not self._connected:
             self._popup_warn("PLC 미연결", "PLC가 연결되지 않아 명령을 전송할 수 없습니다.")
-            self._revert_button_to_plc(binding, fallback=not bool(on))
+            self._revert_button_to_plc(binding, fallback=not on)
             return
 
         # 1) DOOR 특수 처리
@@ -381,76 +411,87 @@ class HmiPlcBinder(QObject):
             # Door 이동 중에는 중복 조작 금지
             if self._is_door_busy():
                 self._popup_warn("인터락", "Door가 열리거나 닫히는 중입니다.\n완료 후 다시 시도하세요.")
-                self._revert_button_to_plc(binding, fallback=not bool(on))
+                self._revert_button_to_plc(binding, fallback=not on)
                 return
 
             # PLC 상태를 아직 못 읽은 경우(초기 폴링 전) → 안전하게 막음
             if "MAIN_SHUTTER_SW" not in self._last_states:
                 self._popup_warn("인터락", "PLC 상태를 아직 읽지 못했습니다.\n잠시 후 다시 시도하세요.")
-                self._revert_button_to_plc(binding, fallback=not bool(on))
+                self._revert_button_to_plc(binding, fallback=not on)
                 return
 
             # Main Shutter 닫힘이면 Door 조작 금지(자동으로 열어주지 않음)
-            if not bool(self._last_states.get("MAIN_SHUTTER_SW", False)):
+            if not self._last_states.get("MAIN_SHUTTER_SW", False):
                 self._popup_warn("인터락", "Main Shutter가 닫혀 있습니다.\nMain Shutter를 먼저 열어주세요.")
-                self._revert_button_to_plc(binding, fallback=not bool(on))
+                self._revert_button_to_plc(binding, fallback=not on)
                 return
 
             # 조건 만족 → Door만 PLC에 전송 + busy window 시작
-            self._worker.enqueue_write("DOOR_SW", bool(on), momentary=False)
+            self._worker.enqueue_write("DOOR_SW", on, momentary=False)
             self._begin_door_busy()
-            self._set_hmi_status(f"DOOR_SW <- {int(bool(on))} (moving)")
+            self._set_hmi_status(f"DOOR_SW <- {int(on)} (moving)")
             return
 
         # 2) MAIN SHUTTER 특수 처리
         if binding.coil_name == "MAIN_SHUTTER_SW":
             # Door 이동 중에는 Main Shutter OFF 금지
-            if self._is_door_busy() and (not bool(on)):
+            if self._is_door_busy() and (not on):
                 self._popup_warn("인터락", "Door가 열리거나 닫히는 중에는\nMain Shutter를 닫을 수 없습니다.")
                 self._revert_button_to_plc(binding, fallback=True)
                 return
 
         # 3) 일반 버튼: 기존 동작 유지
-        self._worker.enqueue_write(binding.coil_name, bool(on), momentary=binding.momentary)
-        self._set_hmi_status(f"{binding.coil_name} <- {int(bool(on))}")
+        self._worker.enqueue_write(binding.coil_name, on, momentary=binding.momentary)
+        self._set_hmi_status(f"{binding.coil_name} <- {int(on)}")
 
     def _on_all_stop_clicked(self) -> None:
         """현재 주소맵 기준: HMI가 다루는 모든 출력 코일을 OFF로."""
         self._set_hmi_status("ALL STOP: set all HMI coils OFF")
 
         # 안전하게: 버튼/램프/펌프/밸브/파워/셔터 모두 OFF
-        for b in self.BUTTONS:
-            self._worker.enqueue_write(b.coil_name, False, momentary=False)
+        #  - 버튼 코일은 전부 coil 0~12(block0)이므로 워커가 FC15 한 번으로 처리
+        self._worker.enqueue_write(_ALL_OFF, False, momentary=False)
 
     # --------------------------------------------------
     # PLC -> UI update
     # --------------------------------------------------
     def _apply_states(self, states_obj: object) -> None:
-        states: Dict[str, bool] = dict(states_obj or {})
-        self._last_states = states
+        # 워커가 폴링마다 새 dict를 만들어 emit하고 아무도 수정하지 않으므로 복사하지 않고 그대로 사용
+        states: Dict[str, bool] = states_obj if isinstance(states_obj, dict) else {}
+
+        # 이전 폴링 대비 값이 바뀐 코일만 UI에 반영(정상 상태에서는 UI 조작 0회)
+        prev = self._last_states
+        changed = {k: v for k, v in states.items() if prev.get(k) != v}
+        dirty = self._dirty_coils
 
         # 1) indicators
         try:
-            for name, coil in self.INDICATORS.items():
-                if hasattr(self.ui, "set_indicator_state"):
-                    self.ui.set_indicator_state(name, bool(states.get(coil, False)))
+            set_indicator = self._set_indicator
+            if set_indicator is not None:
+                for name, coil in self._indicator_items:
+                    if coil in changed:
+                        set_indicator(name, states.get(coil, False))
         except Exception:
             pass
 
         # 2) 버튼 체크 상태(PLC 상태를 UI에 반영)
-        for b in self.BUTTONS:
-            w = getattr(self.ui, b.widget_name, None)
-            if w is None:
+        for b, w in self._btn_widgets.items():
+            if b.coil_name not in changed and b.coil_name not in dirty:
                 continue
-            target = bool(states.get(b.coil_name, False))
+            dirty.discard(b.coil_name)
+            target = states.get(b.coil_name, False)
 
             # programmatic setChecked가 toggled를 발생시키지 않게 SignalBlocker로 막음
+            #  - 이미 같은 상태면 blocker 생성/해제 자체를 생략
             try:
-                with QSignalBlocker(w):
-                    w.setChecked(target)
+                if w.isChecked() != target:
+                    with QSignalBlocker(w):
+                        w.setChecked(target)
             except Exception:
                 pass
 
+        self._last_states = states
+
     def _on_connected(self, ok: bool) -> None:
         self._connected = bool(ok)
         self._set_hmi_status("PLC CONNECTED" if ok else "PLC DISCONNECTED")
@@ -464,6 +505,9 @@ class HmiPlcBinder(QObject):
     # --------------------------------------------------
     def _popup_warn(self, title: str, message: str) -> None:
         """경고창 표시 (요구사항: 경고 후 PLC 전송은 하지 않음)."""
+        # 경고창은 드물게만 뜨므로 QtWidgets는 실제로 필요할 때 import(모듈 로드 비용 절감)
+        from PySide6.QtWidgets import QMessageBox
+
         parent = None
         try:
             btn = getattr(self.ui, "processBtn", None)
@@ -476,30 +520,31 @@ class HmiPlcBinder(QObject):
 
     def _revert_button_to_plc(self, binding: ButtonBinding, fallback: Optional[bool] = None) -> None:
         """사용자 클릭으로 토글된 버튼을 마지막 PLC 상태로 되돌린다."""
-        w = getattr(self.ui, binding.widget_name, None)
+        w = self._btn_widgets.get(binding)
         if w is None:
             return
 
         if binding.coil_name in self._last_states:
-            target = bool(self._last_states.get(binding.coil_name, False))
+            target = self._last_states[binding.coil_name]
         else:
             target = bool(fallback) if fallback is not None else False
 
         try:
-            with QSignalBlocker(w):
-                w.setChecked(target)
+            if w.isChecked() != target:
+                with QSignalBlocker(w):
+                    w.setChecked(target)
         except Exception:
             pass
 
     def _is_door_busy(self) -> bool:
-        return time.monotonic() < float(self._door_busy_until or 0.0)
+        return time.monotonic_ns() < self._door_busy_until_ns
 
     def _begin_door_busy(self) -> None:
         """Door 명령 전송 시점부터 door_move_time_s 동안 busy로 간주."""
         move_s = float(getattr(self.settings, "door_move_time_s", 10.0) or 10.0)
         move_s = max(0.1, move_s)
 
-        self._door_busy_until = time.monotonic() + move_s
+        self._door_busy_until_ns = time.monotonic_ns() + int(move_s * 1e9)
         try:
             self._door_busy_timer.stop()
             self._door_busy_timer.start(int(move_s * 1000))
@@ -507,21 +552,29 @@ class HmiPlcBinder(QObject):
             pass
 
     def _end_door_busy(self) -> None:
-        self._door_busy_until = 0.0
+        self._door_busy_until_ns = 0
         self._set_hmi_status("DOOR: move done")
 
     def _set_hmi_status(self, text: str) -> None:
-        w = getattr(self.ui, "processMonitor_HMI", None)
-        if w is not None:
-            try:
-                w.setText(text)
-            except Exception:
-                pass
+        self._pending_status = text
+        if not self._text_flush_timer.isActive():
+            self._text_flush_timer.start()
 
     def _set_hmi_log(self, text: str) -> None:
-        w = getattr(self.ui, "hmiLogWindow", None)
-        if w is not None:
-            try:
-                w.setText(text)
-            except Exception:
-                pass
+        self._pending_log = text
+        if not self._text_flush_timer.isActive():
+            self._text_flush_timer.start()
+
+    def _flush_hmi_text(self) -> None:
+        """모아둔 상태/로그 텍스트를 위젯에 한 번씩만 반영."""
+        for name, text in (("processMonitor_HMI", self._pending_status), ("hmiLogWindow", self._pending_log)):
+            if text is None:
+                continue
+            w = getattr(self.ui, name, None)
+            if w is not None:
+                try:
+                    w.setText(text)
+                except Exception:
+                    pass
+        self._pending_status = None
+        self._pending_log = None
@@ -1,10 +1,13 @@
 # devices/acs2000.py
 from __future__ import annotations
 
+import re
+import threading
 import time
-from typing import Optional, Tuple
+from collections import deque
+from typing import Deque, Optional
 
-from utils.base_serial import BaseSerialDevice, SerialDeviceError
+from utils.base_serial import _TIMEOUT_SLACK_S, BaseSerialDevice, SerialDeviceError
 
 
 class ACS2000ProtocolError(SerialDeviceError):
@@ -25,12 +28,46 @@ def _eom_bytes(eom: Optional[str]) -> bytes:
     raise ValueError(f"Unsupported EOM={eom!r} (use CR or CRLF)")
 
 
-# 매뉴얼의 List of commands (문서화 목적)
-ACS2000_COMMANDS = [
+# 응답 1줄 최대 길이(이 이상 CR이 안 오면 깨진 스트림으로 보고 끊는다)
+_MAX_FRAME = 512
+
+# 압력 응답 파싱 fallback용 숫자 토큰(1.0E-03, -5, .5 등) — decode 없이 bytes에 바로 적용
+_NUM_RE = re.compile(rb"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _parse_pressure(rx: bytes) -> float:
+    """PRD 응답/CON 스트림 1줄(bytes, CR 제외) → 압력값. decode 없이 bytes에서 바로 파싱."""
+    # 응답 bytes에서 마지막 필드만 잘라서 바로 float (decode/replace/split 없이)
+    last = rx.rstrip(b", ").rpartition(b",")[2].strip().lstrip(b"$")
+    try:
+        return float(last)
+    except ValueError:
+        pass
+
+    # fallback: '$' 삭제(translate 1패스) → ',' split 1번 → 뒤에서부터 빈 토큰/OK는 건너뜀
+    for tok in reversed(rx.translate(None, b"$").split(b",")):
+        tok = tok.strip()
+        if not tok or tok == b"OK":
+            continue
+        # 단위 등이 붙은 경우("2.5E-03 mbar") → 숫자 토큰만 추출
+        nums = _NUM_RE.findall(tok)
+        if nums:
+            return float(nums[-1])
+        break
+
+    raw = rx.decode("ascii", errors="replace").strip()
+    raise ACS2000ProtocolError(f"cannot parse pressure reply: {raw!r}")
+
+
+# 매뉴얼의 List of commands (문서화 + `cmd in ACS2000_COMMANDS` O(1) 조회용)
+ACS2000_COMMANDS: frozenset[str] = frozenset({
     "BAU", "CON", "CPF", "DGS", "DGT", "ERR", "FDS", "FLT", "FSR", "GAS",
     "LOC", "OFS", "PRD", "PRT", "RMS", "RTY", "SPS", "SP1", "SP2", "TAS",
     "TID", "TPM", "TRS", "UNI", "VER",
-]
+})
+
+# "$CMD" 인코딩 결과를 모듈 로드 시 1번만 만든다(요청마다 strip/encode 반복 방지)
+_ACS_CMD_CACHE: dict[str, bytes] = {name: ("$" + name).encode("ascii") for name in ACS2000_COMMANDS}
 
 
 class ACS2000(BaseSerialDevice):
@@ -43,106 +80,184 @@ class ACS2000(BaseSerialDevice):
     - EOM: 기본 CR
     """
 
-    def __init__(self, *, eom: str = "CR", **kwargs):
+    def __init__(self, *, eom: str = "CR", reset_io_each_tx: bool = False, **kwargs):
         super().__init__(**kwargs)
         self._eom = _eom_bytes(eom)
+        # PRD 요청 프레임은 채널(1/2)별로 EOM까지 붙여서 미리 만들어 둔다(요청마다 encode/연결 없음)
+        self._prd_tx: dict[int, bytes] = {ch: b"$PRD,%d%s" % (ch, self._eom) for ch in (1, 2)}
+        # 청크 read로 CR 뒤까지 읽힌 바이트(다음 _read_until_cr에서 먼저 사용)
+        self._rx_tail = b""
+
+        # 송신 전 입출력 버퍼 reset 정책
+        #  - 장비는 요청받았을 때만 응답하므로 정상 상태에서는 reset(syscall 2회)이 필요 없다.
+        #  - timeout/예외/CON 스트림 시작 후에는 _rx_dirty로 표시해 다음 송신 전에 1번만 reset
+        #  - reset_io_each_tx=True면 기존처럼 매 송신마다 reset
+        self._reset_io_each_tx = reset_io_each_tx
+        self._rx_dirty = True
 
     def _read_until_cr(self, timeout_s: float) -> bytes:
         """
         CR까지 읽는다. (CR 뒤에 LF가 올 수 있음)
+
+        - 1바이트씩 read(1) 하지 않고, 버퍼에 쌓인 만큼 한 번에 읽은 뒤 CR을 찾는다.
+        - 대기는 ser.timeout(남은 시간)으로 pyserial(C 레벨)에서 블록한다.
+        - CR 뒤에 같이 읽힌 바이트(스트림 모드의 다음 줄 등)는 _rx_tail에 보관 → 다음 호출에서 사용
         """
         with self._lock:
-            ser = self._require()
-            t0 = time.time()
-            buf = bytearray()
-
-            while time.time() - t0 < timeout_s:
-                b = ser.read(1)
-                if not b:
+            return self._read_until_cr_locked(self._require(), timeout_s)
+
+    def _read_until_cr_locked(self, ser, timeout_s: float) -> bytes:
+        """_read_until_cr 본체. 호출자가 self._lock을 이미 잡고 있어야 한다(_txrx_bytes 등)."""
+        # 루프 안에서 반복되는 속성 조회를 지역 변수로(LOAD_FAST)
+        monotonic = time.monotonic
+        ser_read = ser.read
+        deadline = monotonic() + timeout_s
+
+        # 청크는 list에 모아 마지막에 join 1번(bytearray += 반복 없음)
+        #  - CR 검색은 새로 들어온 청크에만 → 이미 본 바이트를 다시 스캔하지 않음
+        chunks: list[bytes] = []
+        total = len(self._rx_tail)
+        tail = self._rx_tail
+        self._rx_tail = b""
+        if tail:
+            chunks.append(tail)
+        idx = tail.find(b"\r")
+
+        # timeout은 루프 전에 1번만 설정하고, 남은 시간보다 _TIMEOUT_SLACK_S 넘게 길 때만 줄인다
+        #  (timeout 대입 = 포트 재설정 syscall → 청크마다 하지 않음)
+        old_to = ser.timeout
+        cur_to = timeout_s
+        if cur_to != old_to:
+            ser.timeout = cur_to
+        try:
+            while idx < 0:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return b"".join(chunks)
+                if cur_to - remaining > _TIMEOUT_SLACK_S:
+                    ser.timeout = cur_to = remaining
+                chunk = ser_read(max(1, min(ser.in_waiting, _MAX_FRAME - total)))
+                if not chunk:
                     continue
-                buf += b
-                if b == b"\r":
-                    # optional LF discard
-                    old_to = ser.timeout
-                    ser.timeout = 0.05
-                    _ = ser.read(1)
-                    ser.timeout = old_to
-                    break
-
-            return bytes(buf)
-
-    def _txrx(self, payload_no_eom: str, rx_timeout_s: float = 0.8) -> str:
+                chunks.append(chunk)
+                idx = chunk.find(b"\r")
+                total += len(chunk)
+                if idx < 0 and total >= _MAX_FRAME:
+                    # CR 없이 계속 들어오는 쓰레기 데이터 → 프레임 상한에서 끊음(read_until(size=)와 동일)
+                    return b"".join(chunks)
+
+            # idx는 마지막 청크 안의 CR 위치
+            last = chunks[-1]
+            chunks[-1] = last[:idx + 1]
+            rest = last[idx + 1:]
+
+            # optional LF discard
+            #  - 이미 버퍼에 들어와 있을 때만 읽는다(타임아웃 대기/ser.timeout 토글 없음)
+            #  - 늦게 도착한 LF는 다음 프레임 맨 앞에서 제거
+            if not rest and ser.in_waiting:
+                rest = ser_read(1)
+            if rest[:1] == b"\n":
+                rest = rest[1:]
+            self._rx_tail = rest
+        finally:
+            if cur_to != old_to:
+                ser.timeout = old_to
+
+        frame = b"".join(chunks)
+        if frame[:1] == b"\n":
+            frame = frame[1:]
+        return frame
+
+    def _txrx_bytes(self, tx: bytes, rx_timeout_s: float = 0.8) -> str:
         """
-        payload_no_eom 예: "$VER", "$PRD,1"
+        이미 인코딩된 프레임(EOM 포함)을 그대로 송신하는 fast path.
+        tx 예: b"$PRD,1\r"
         """
-        if not payload_no_eom.startswith("$"):
-            raise ValueError("ACS2000 payload must start with '$'")
+        return self._exchange(tx, rx_timeout_s).decode("ascii", errors="replace").strip()
 
-        tx = payload_no_eom.encode("ascii", errors="replace") + self._eom
+    def _exchange(self, tx: bytes, rx_timeout_s: float = 0.8) -> bytes:
+        """송신 + 응답 1줄 수신.
 
+        - 반환: 종단(CR)을 뗀 응답 프레임(bytes). decode는 외부 API 경계에서만 한다.
+        """
         with self._lock:
             ser = self._require()
-            ser.reset_input_buffer()
-            ser.reset_output_buffer()
-            ser.write(tx)
-            ser.flush()
-            rx = self._read_until_cr(timeout_s=rx_timeout_s)
+            if self._reset_io_each_tx or self._rx_dirty or self._rx_tail:
+                ser.reset_input_buffer()
+                ser.reset_output_buffer()
+                self._rx_tail = b""  # 이전 응답의 잔여 바이트도 함께 버림
+                self._rx_dirty = False
+            try:
+                ser.write(tx)
+                ser.flush()
+                rx = self._read_until_cr_locked(ser, rx_timeout_s)  # 이미 lock 보유 → 재획득 없음
+            except Exception:
+                self._rx_dirty = True
+                raise
+
+            complete = rx[-1:] == b"\r"
+            # 응답이 잘렸거나(timeout) 스트림(CON)을 켠 경우 → 다음 송신 전에 버퍼 정리
+            if not complete or tx[:4] == b"$CON":
+                self._rx_dirty = True
 
         if not rx:
-            raise ACS2000ProtocolError(f"no response for '{payload_no_eom}'")
+            cmd = tx.rstrip(b"\r\n").decode("ascii", errors="replace")
+            raise ACS2000ProtocolError(f"no response for '{cmd}'")
 
-        return rx.decode("ascii", errors="replace").strip()
+        return rx[:-1] if complete else rx
 
     # ✅ 매뉴얼의 "모든 명령"을 커버하는 범용 RAW
     def raw(self, command: str, *params: str, rx_timeout_s: float = 0.8) -> str:
-        cmd = command.strip().upper()
+        # 상수 명령("VER", "CON" 등 정규형)은 strip/upper 생략
+        cmd = command if command in ACS2000_COMMANDS else command.strip().upper()
         if not cmd:
             raise ValueError("command empty")
 
-        parts = ["$" + cmd]
-        if params:
-            parts.extend(str(p) for p in params)
+        stem = _ACS_CMD_CACHE.get(cmd)
+        if stem is None:
+            stem = ("$" + cmd).encode("ascii", errors="replace")
 
-        payload = ",".join(parts)
-        reply = self._txrx(payload, rx_timeout_s=rx_timeout_s)
+        if params:
+            tail = ",".join(str(p) for p in params).encode("ascii", errors="replace")
+            tx = b"".join((stem, b",", tail, self._eom))
+        else:
+            tx = stem + self._eom
+        rx = self._exchange(tx, rx_timeout_s=rx_timeout_s).strip()
 
-        # reply도 '$'로 시작하므로 data만 반환
-        if reply.startswith("$"):
-            reply = reply[1:]
-        return reply.strip()
+        # reply도 '$'로 시작하므로 data만 반환(bytes에서 자르고 decode는 마지막에 1번)
+        if rx[:1] == b"$":
+            rx = rx[1:].lstrip()
+        return rx.decode("ascii", errors="replace")
 
     # 기존 스타일 유지(통합 프로그램에서 자주 쓰는 최소 셋)
     def query_version(self) -> str:
         return self.raw("VER")
 
     def query_pressure(self, channel: int = 1) -> float:
-        if channel not in (1, 2):
+        tx = self._prd_tx.get(channel)
+        if tx is None:
             raise ValueError("ACS2000 channel must be 1 or 2")
 
-        raw = self._txrx(f"$PRD,{channel}", rx_timeout_s=0.8)
-        s = raw.replace("$", "").strip()
-
-        tokens = [t.strip() for t in s.split(",") if t.strip()]
-        cand = tokens[-1] if tokens else s
-
-        try:
-            return float(cand)
-        except ValueError:
-            for t in reversed(s.split()):
-                try:
-                    return float(t)
-                except ValueError:
-                    continue
-            raise ACS2000ProtocolError(f"cannot parse pressure reply: {raw!r}")
+        rx = self._exchange(tx, rx_timeout_s=0.8)
+        return _parse_pressure(rx)
 
     def start_pressure_stream(self, interval_a: int = 1) -> str:
-        return self._txrx(f"$CON,{interval_a}", rx_timeout_s=0.8)
+        return self._txrx_bytes(b"$CON,%d%s" % (interval_a, self._eom), rx_timeout_s=0.8)
 
-    def read_stream_line(self, timeout_s: float = 2.0) -> str:
+    def _read_stream_frame(self, timeout_s: float) -> bytes:
         rx = self._read_until_cr(timeout_s=timeout_s)
+        self._rx_dirty = True  # 스트림 수신 중 → 다음 명령 송신 전에 쌓인 샘플을 버림
         if not rx:
             raise ACS2000ProtocolError("stream timeout/no data")
-        return rx.decode("ascii", errors="replace").strip()
+        return rx[:-1] if rx[-1:] == b"\r" else rx
+
+    def read_stream_line(self, timeout_s: float = 2.0) -> str:
+        """CON 스트림 1줄을 문자열로(디버깅/로그용)."""
+        return self._read_stream_frame(timeout_s).decode("ascii", errors="replace").strip()
+
+    def read_stream_value(self, timeout_s: float = 2.0) -> float:
+        """CON 스트림 1줄 → 압력값(float). 중간 str 생성 없이 bytes에서 바로 파싱."""
+        return _parse_pressure(self._read_stream_frame(timeout_s))
 
     def stop_stream_safe(self) -> None:
         self.close()
@@ -164,3 +279,74 @@ class ACS2000(BaseSerialDevice):
 
     def get_pressure(self, channel: int = 1) -> float:
         return self.query_pressure(channel)
+
+
+class ACS2000Reader(threading.Thread):
+    """
+    ACS-2000 CON 스트림을 전용 스레드에서 계속 읽어두는 producer.
+
+    - 시리얼 I/O(lock 보유 구간)는 이 스레드에서만 일어나고,
+      UI/제어 쪽은 get_latest_pressure()로 마지막 값만 가져간다(lock 없음).
+    - history: 최근 N개 샘플(deque(maxlen)) — 소비자가 없어도 메모리가 무한히 늘지 않음
+    - 통신 오류 시 retry_s 후 CON을 다시 보내 스트림을 재개한다.
+    """
+
+    def __init__(self, dev: ACS2000, *, interval_a: int = 1, timeout_s: float = 2.0,
+                 retry_s: float = 1.0, history: int = 256):
+        super().__init__(name="ACS2000Reader", daemon=True)
+        self._dev = dev
+        self._interval_a = interval_a
+        self._timeout_s = timeout_s
+        self._retry_s = retry_s
+        self._stop_evt = threading.Event()
+
+        # 단일 참조 대입/읽기는 CPython에서 원자적 → 별도 lock 없이 공유
+        self._latest: Optional[float] = None
+        self._latest_ts: float = 0.0
+        self.history: Deque[float] = deque(maxlen=max(1, history))
+        self.last_error: Optional[Exception] = None
+
+    def get_latest_pressure(self) -> Optional[float]:
+        """마지막으로 수신한 압력값(아직 없으면 None)."""
+        return self._latest
+
+    def latest_age_s(self) -> float:
+        """마지막 샘플 이후 경과 시간(초). 샘플이 없으면 inf."""
+        ts = self._latest_ts
+        return time.monotonic() - ts if ts else float("inf")
+
+    def stop(self, timeout_s: Optional[float] = None) -> None:
+        """스레드 중지(현재 read가 끝날 때까지 최대 timeout_s 대기) 후 CON 스트림 정지.
+
+        스트림을 켜 둔 채 두면 아무도 읽지 않는 포트에 샘플이 계속 쌓이므로 stop_stream_safe()로 끝낸다.
+        """
+        self._stop_evt.set()
+        if self.is_alive():
+            self.join(self._timeout_s + 0.5 if timeout_s is None else timeout_s)
+        try:
+            self._dev.stop_stream_safe()
+        except Exception:
+            pass
+
+    def run(self) -> None:
+        dev = self._dev
+        stop_evt = self._stop_evt
+        push = self.history.append
+        monotonic = time.monotonic
+
+        need_start = True
+        while not stop_evt.is_set():
+            try:
+                if need_start:
+                    dev.start_pressure_stream(self._interval_a)
+                    need_start = False
+                v = dev.read_stream_value(timeout_s=self._timeout_s)
+            except Exception as e:
+                self.last_error = e
+                need_start = True
+                stop_evt.wait(self._retry_s)
+                continue
+
+            self._latest = v
+            self._latest_ts = monotonic()
+            push(v)
@@ -11,16 +11,26 @@ PLC.py — Evaporator용 Modbus-RTU(RS-232) PLC 컨트롤러 (Async)
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
+import struct
 import time
+from collections import deque
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Deque, Dict, Final, Iterable, List, NamedTuple, Optional, Tuple
 
 from pymodbus.client import ModbusSerialClient
 from pymodbus.exceptions import ModbusException
 from pymodbus.pdu import ExceptionResponse
 
+# pyserial 포트 오류(포트 분리/USB 재열거 등) → 연결 리셋으로 취급. 쓰기 타임아웃은 제외
+try:
+    from serial import SerialException, SerialTimeoutException
+except Exception:
+    SerialException = SerialTimeoutException = ()
+
 # ✅ pymodbus 3.x: framer 사용, 구버전: method 사용 → 둘 다 되게 처리
 try:
     from pymodbus import FramerType
@@ -36,43 +46,310 @@ except Exception:
 #    예) M0000B = 0x0B = 11, M00020 = 0x20 = 32
 # 이 dict 값은 pymodbus에 전달되는 "Modbus coil address (0-based int)" 입니다.
 
+# 자주 쓰는 주소는 모듈 상수(int)로 정의 → hot path에서 dict 조회(문자열 해시) 없이 바로 사용
+#  (아래 dict는 이 상수로 만들며, 사람이 읽는 덤프/UI/이름 해석용으로 그대로 유지)
+
+# --- Rotary Pump / Valves / Turbo ---
+PLC_COIL_R_P_SW: Final = 0    # M00000 (RP)
+PLC_COIL_R_V_SW: Final = 1    # M00001 (RV)
+PLC_COIL_F_V_SW: Final = 2    # M00002 (FV)
+PLC_COIL_M_V_SW: Final = 3    # M00003 (MV)
+PLC_COIL_V_V_SW: Final = 4    # M00004 (V/V)
+PLC_COIL_TMP_SW: Final = 5    # M00005 (TMP)
+
+# --- Shutters / Thickness Monitor ---
+PLC_COIL_SHUTTER_1_SW: Final = 6     # M00006 (Shutter1)
+PLC_COIL_SHUTTER_2_SW: Final = 7     # M00007 (Shutter2)
+PLC_COIL_MAIN_SHUTTER_SW: Final = 8  # M00008 (Main Shutter)
+PLC_COIL_POWER_1_SW: Final = 9       # M00009 (POWER1)
+PLC_COIL_POWER_2_SW: Final = 10      # M0000A (POWER2)
+PLC_COIL_FTM_SW: Final = 11          # M0000B (FTM)
+PLC_COIL_DOOR_SW: Final = 12         # M0000C (DOOR)
+
+# --- Utilities / Gas ---
+PLC_COIL_AIR_SW: Final = 32    # M00020 (Air)
+PLC_COIL_WATER_SW: Final = 33  # M00021 (Water)
+PLC_COIL_GAS_1_SW: Final = 34  # M00022 (G1)
+PLC_COIL_GAS_2_SW: Final = 35  # M00023 (G2)
+
+# D영역(아날로그 출력)도 PLC 문서 기준 주석을 명확히 남깁니다.
+PLC_REG_DAC_POWER_1: Final = 0  # D00000
+PLC_REG_DAC_POWER_2: Final = 1  # D00001
+
 PLC_COIL_MAP: Dict[str, int] = {
-    # --- Rotary Pump / Valves / Turbo ---
-    "R_P_SW": 0,    # M00000 (RP)
-    "R_V_SW": 1,    # M00001 (RV)
-    "F_V_SW": 2,    # M00002 (FV)
-    "M_V_SW": 3,    # M00003 (MV)
-    "V_V_SW": 4,    # M00004 (V/V)
-    "TMP_SW": 5,    # M00005 (TMP)
-
-    # --- Shutters / Thickness Monitor ---
-    "SHUTTER_1_SW": 6,    # M00006 (Shutter1)
-    "SHUTTER_2_SW": 7,    # M00007 (Shutter2)
-    "MAIN_SHUTTER_SW": 8, # M00008 (Main Shutter)
-    "POWER_1_SW": 9,      # M00009 (POWER1)
-    "POWER_2_SW": 10,     # M0000A (POWER2)
-    "FTM_SW": 11,         # M0000B (FTM)
-    "DOOR_SW": 12,        # M0000C (DOOR)
-
-    # --- Utilities / Gas ---
-    "AIR_SW": 32,    # M00020 (Air)
-    "WATER_SW": 33,  # M00021 (Water)
-    "GAS_1_SW": 34,  # M00022 (G1)
-    "GAS_2_SW": 35,  # M00023 (G2)
+    "R_P_SW": PLC_COIL_R_P_SW,
+    "R_V_SW": PLC_COIL_R_V_SW,
+    "F_V_SW": PLC_COIL_F_V_SW,
+    "M_V_SW": PLC_COIL_M_V_SW,
+    "V_V_SW": PLC_COIL_V_V_SW,
+    "TMP_SW": PLC_COIL_TMP_SW,
+
+    "SHUTTER_1_SW": PLC_COIL_SHUTTER_1_SW,
+    "SHUTTER_2_SW": PLC_COIL_SHUTTER_2_SW,
+    "MAIN_SHUTTER_SW": PLC_COIL_MAIN_SHUTTER_SW,
+    "POWER_1_SW": PLC_COIL_POWER_1_SW,
+    "POWER_2_SW": PLC_COIL_POWER_2_SW,
+    "FTM_SW": PLC_COIL_FTM_SW,
+    "DOOR_SW": PLC_COIL_DOOR_SW,
+
+    "AIR_SW": PLC_COIL_AIR_SW,
+    "WATER_SW": PLC_COIL_WATER_SW,
+    "GAS_1_SW": PLC_COIL_GAS_1_SW,
+    "GAS_2_SW": PLC_COIL_GAS_2_SW,
 }
 
-# D영역(아날로그 출력)도 PLC 문서 기준 주석을 명확히 남깁니다.
 PLC_REG_MAP: Dict[str, int] = {
-    "DAC_POWER_1": 0,  # D00000
-    "DAC_POWER_2": 1,  # D00001
+    "DAC_POWER_1": PLC_REG_DAC_POWER_1,
+    "DAC_POWER_2": PLC_REG_DAC_POWER_2,
 }
 
 
+# 일괄 읽기(read_many/snapshot)용 그룹핑 기준
+#  - 코일은 비트라 빈 주소 몇십 개를 같이 읽어도 프레임이 몇 바이트 늘 뿐 → 요청 수를 줄이는 쪽이 이득
+#  - 레지스터는 워드 단위라 작은 gap만 허용
+_COIL_MAX_GAP = 32
+_REG_MAX_GAP = 4
+
+# heartbeat 때 함께 읽어 캐시해 두는 코일 블록(HMI 상태 코일 M00000~M0000C)
+_HB_START = PLC_COIL_R_P_SW
+_HB_COUNT = PLC_COIL_DOOR_SW - _HB_START + 1
+
+# 연결 리셋 오류 후 재연결·재시도 전 대기(리셋 직후 바로 다시 열면 실패하는 USB-serial 대비)
+_RESET_RETRY_S = 0.05
+
+# 직접 송수신(FC05/06) 실패 후 입력 버퍼를 비우기 전 대기(늦게 도착하는 에코까지 받아서 버림)
+_RTU_QUIET_S = 0.05
+
+# _call()로 부르는 pymodbus 클라이언트 메서드(connect 때 bound method로 미리 묶음)
+_CLIENT_OPS = (
+    "read_coils", "write_coil", "write_coils",
+    "read_holding_registers", "write_register", "write_registers",
+)
+
+# _resolve() 결과 캐시 상한(맵/동의어 외 임의 문자열이 무한히 쌓이지 않게)
+_RESOLVE_CACHE_MAX = 256
+
+_Run = Tuple[int, int, Tuple[Tuple[Any, int], ...]]  # (start, count, ((key, offset), ...))
+
+
+class _Resolved(NamedTuple):
+    """_resolve() 결과. 튜플이라 `addr, kind = ...` 언패킹 그대로 사용 가능."""
+    addr: int
+    kind: str  # "coil" / "reg" / "raw"
+
+
+def _group_runs(addr_of: Dict[Any, int], max_gap: int) -> Tuple[_Run, ...]:
+    """{key: addr} → 연속(또는 gap 이하로 떨어진) 주소 묶음 목록.
+
+    각 묶음은 read_coils/read_holding_registers 한 번으로 읽고,
+    결과는 offset으로 key에 다시 뿌린다.
+    """
+    runs: List[_Run] = []
+    start = prev = -1
+    members: List[Tuple[Any, int]] = []
+    for key, addr in sorted(addr_of.items(), key=lambda kv: kv[1]):
+        if members and addr - prev > max_gap:
+            runs.append((start, prev - start + 1, tuple(members)))
+            members = []
+        if not members:
+            start = addr
+        members.append((key, addr - start))
+        prev = addr
+    if members:
+        runs.append((start, prev - start + 1, tuple(members)))
+    return tuple(runs)
+
+
+# 전체 주소맵 스냅샷용 묶음(import 시 1번 계산): 현재 맵 기준 FC1 1회 + FC3 1회
+_COIL_RUNS = _group_runs(PLC_COIL_MAP, _COIL_MAX_GAP)
+_REG_RUNS = _group_runs(PLC_REG_MAP, _REG_MAX_GAP)
+
+
+_mono_ns = time.monotonic_ns  # 시각 비교는 정수 ns로(로그 낼 때만 ms로 변환)
+
+# 이름 정규화: 공백/_/-/ 제거를 replace 4번 대신 translate 1번으로(같은 입력은 lru_cache로 재사용)
+_DROP_TABLE = str.maketrans("", "", " _-/")
+
+
+@functools.lru_cache(maxsize=256)
+def _norm(s: str) -> str:
+    return s.strip().upper().translate(_DROP_TABLE)
+
+
+def _meta_str(meta: Dict[str, Any]) -> str:
+    """_io_lock 경고 로그용 ' [addr=.., count=..]' (경고가 실제로 날 때만 만든다)."""
+    extra = [f"{k}={meta[k]}" for k in ("addr", "count") if meta.get(k) is not None]
+    return (" [" + ", ".join(extra) + "]") if extra else ""
+
+
+# ======================================================
+# Modbus-RTU 프레임 직접 송수신(FC05/FC06 단일 쓰기 전용)
+# ======================================================
+#  - 요청은 8바이트 고정, 정상 응답은 요청 에코(8바이트), 예외 응답은 5바이트
+#  - 입력 버퍼 정리 + 송신 + 응답 수신을 동기 함수 하나(_rtu_exchange)로 묶어 PLC executor에서 실행
+#    → 취소로 게이트가 풀려도 남은 호출이 끝나기 전에 다음 호출이 포트를 건드리지 않는다(워커 1개)
+
+def _make_crc_table() -> Tuple[int, ...]:
+    tab = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        tab.append(crc)
+    return tuple(tab)
+
+
+_CRC_TAB = _make_crc_table()
+
+
+def _crc16(frame) -> int:
+    """Modbus CRC-16(poly 0xA001, init 0xFFFF). 256칸 표로 바이트당 1회 조회."""
+    tab = _CRC_TAB
+    crc = 0xFFFF
+    for b in frame:
+        crc = (crc >> 8) ^ tab[(crc ^ b) & 0xFF]
+    return crc
+
+
+_ADU_HEAD = struct.Struct(">BBHH")  # unit, fc, addr, value
+_ADU_CRC = struct.Struct("<H")      # CRC는 little-endian
+
+
+def _rtu_adu(unit: int, fc: int, addr: int, value: int) -> bytes:
+    """8바이트 요청 프레임(불변 bytes → executor 스레드에 넘겨도 다음 호출과 공유되지 않음)."""
+    head = _ADU_HEAD.pack(unit, fc, addr, value)
+    return head + _ADU_CRC.pack(_crc16(head))
+
+
+def _rtu_read_reply(ser, n: int) -> bytes:
+    """응답 n바이트 수신(예외 응답이면 5바이트에서 끝). 부족하면 받은 만큼만 반환."""
+    head = ser.read(5)
+    if len(head) < 5 or head[1] & 0x80:
+        return head
+    return head + ser.read(n - 5)
+
+
+def _rtu_is_exc_reply(reply: bytes, fc: int) -> bool:
+    """정상적인 Modbus 예외 응답(5바이트, fc|0x80, CRC 일치)인지."""
+    return len(reply) == 5 and reply[1] == (fc | 0x80) and _crc16(reply[:3]) == int.from_bytes(reply[3:], "little")
+
+
+def _rtu_exchange(ser, adu: bytes, flush_input: bool) -> bytes:
+    """(executor 스레드) 필요 시 입력 버퍼 정리 → 요청 송신 → 응답 수신.
+
+    응답이 없거나 어긋나면(timeout/불일치) 늦게 오는 에코가 다음 pymodbus 트랜잭션에
+    섞이지 않도록, 잠깐 조용히 기다린 뒤 입력 버퍼를 비우고 돌아간다.
+    """
+    if flush_input:
+        ser.reset_input_buffer()
+    ser.write(adu)
+    reply = _rtu_read_reply(ser, len(adu))
+    if reply != adu and not _rtu_is_exc_reply(reply, adu[1]):
+        time.sleep(_RTU_QUIET_S)
+        ser.reset_input_buffer()
+    return reply
+
+
+# pymodbus 버전별 API 차이 판별(클라이언트 클래스당 1번만 inspect → 인스턴스/재연결 간 공유)
+@functools.lru_cache(maxsize=None)
+def _client_params(client_cls: type) -> frozenset:
+    """ModbusSerialClient 생성자가 받는 키워드 이름들."""
+    return frozenset(inspect.signature(client_cls).parameters)
+
+
+def _uid_kw_by_version(ver: str) -> Optional[str]:
+    """버전 문자열로 확실한 구간만 판정: 2.x → unit, 3.0~3.8 → slave. 그 외/파싱 실패는 None(inspect로 판별)."""
+    try:
+        major, minor = (int(x) for x in ver.split(".")[:2])
+    except Exception:
+        return None
+    if major < 3:
+        return "unit"
+    if major == 3 and minor < 9:
+        return "slave"
+    return None
+
+
+try:
+    import pymodbus as _pymodbus
+    _PYMODBUS_UID_KW = _uid_kw_by_version(str(getattr(_pymodbus, "__version__", "")))
+except Exception:
+    _PYMODBUS_UID_KW = None
+
+
+@functools.lru_cache(maxsize=None)
+def _uid_kw_for(client_cls: type) -> Optional[str]:
+    """write_coil 등의 장치 ID 키워드: device_id(3.9+) / slave(3.x) / unit(2.x) / None."""
+    if _PYMODBUS_UID_KW is not None:
+        return _PYMODBUS_UID_KW
+    try:
+        params = inspect.signature(client_cls.write_coil).parameters
+    except Exception:
+        return None
+    for kw in ("device_id", "slave", "unit"):
+        if kw in params:
+            return kw
+    return None
+
+
+class _IoGate:
+    """PLC 포트 1개용 FIFO 뮤텍스(asyncio.Lock 대체).
+
+    - 비어 있으면 Future 생성 없이 바로 획득
+    - release는 다음 대기자에게 소유권을 직접 넘긴다(busy 유지)
+      → 방금 놓은 코루틴이 await 없이 곧바로 다시 잡아 대기자를 새치기하지 못함(도착 순서 보장)
+    """
+
+    __slots__ = ("_busy", "_waiters")
+
+    def __init__(self) -> None:
+        self._busy = False
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def locked(self) -> bool:
+        return self._busy
+
+    def try_acquire(self) -> bool:
+        """비어 있으면 await 없이 즉시 획득(True). 아니면 False → acquire()로 대기."""
+        if self._busy:
+            return False
+        self._busy = True
+        return True
+
+    async def acquire(self) -> None:
+        if not self._busy:
+            self._busy = True
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # 소유권을 넘겨받은 직후 취소됨 → 다음 대기자에게 다시 넘긴다
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        waiters = self._waiters
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._busy = False
+
+
 # ======================================================
 # 2) 설정
 # ======================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PLCConfig:
     port: str = "COM5"
     method: str = "rtu"       # (구버전용) 보통 rtu
@@ -105,6 +382,10 @@ class PLCConfig:
 # ======================================================
 
 class AsyncPLC:
+    # 이름 표는 모듈 상수(맵)에서만 만들어지므로 클래스당 1번(클래스 정의 직후 채움)
+    _SYNONYMS: ClassVar[Dict[str, str]]
+    _RESOLVED_BASE: ClassVar[Dict[Any, _Resolved]]
+
     def __init__(
         self,
         port: str = "COM5",
@@ -144,18 +425,36 @@ class AsyncPLC:
             dac_current_max_ma=float(dac_current_max_ma),
         )
 
+        # 매 I/O마다 읽는 값은 인스턴스 속성으로 복사(cfg는 frozen이라 바뀔 일 없음)
+        self._gap_ns = int(self.cfg.inter_cmd_gap_s * 1e9)
+        self._hb_s = self.cfg.heartbeat_s
+        self._lock_warn_ns = int(self.cfg.lock_warn_ms * 1e6)
+        self._io_warn_ns = int(self.cfg.io_warn_ms * 1e6)
+        self._pulse_ms = self.cfg.pulse_ms
+
         self._client: Optional[ModbusSerialClient] = None
         self._uid_kw: Optional[str] = None  # 'unit' or 'slave'
+        self._uid_kw_cached: Dict[str, int] = {}  # I/O 호출마다 넘길 {uid_kw: unit} (connect 시 1번 생성)
+        self._ops: Dict[str, Callable[..., Any]] = {}  # _CLIENT_OPS 이름 → 현재 클라이언트의 bound method
+        self._dac_scale: Optional[Tuple[float, float, int, int]] = None  # _dac_params() 캐시
+        self._dac_range_cache: Optional[Tuple[int, int]] = None  # _dac_range() 캐시
+
+        self._lock = _IoGate()
+        self._last_io_ns = 0
+        self._ll_port: object = None  # low-latency 설정을 마친 serial 객체(재연결 시 다시 설정)
+        self._rtu_dirty: bool = True  # 직접 송수신 실패/미사용 후 → 다음 송신 전에 입력 버퍼 비우기
+        self._bit_cache: Dict[int, Tuple[bool, int]] = {}  # addr → (값, _mono_ns 시각)
 
-        self._lock = asyncio.Lock()
-        self._last_io_ts = 0.0
+        self._exec: Optional[ThreadPoolExecutor] = None  # _run() 전용(처음 쓸 때 생성, close에서 정리)
 
         self._hb_task: Optional[asyncio.Task] = None
         self._hb_paused: bool = False
         self._closed: bool = False
 
         self.log = logger or (lambda *a, **k: None)
-        self._SYNONYMS: Dict[str, str] = self._build_synonyms()
+        self._log_enabled = logger is not None  # False면 _io_lock 경고 판단/문자열 생성 자체를 생략
+        # 클래스 공용 기본표를 복사해서 시작(인스턴스별로 _resolve 미스 결과가 추가됨)
+        self._resolved: Dict[Any, _Resolved] = dict(self._RESOLVED_BASE)
 
     # --------------------------
     # lifecycle
@@ -163,7 +462,7 @@ class AsyncPLC:
     async def connect(self) -> None:
         self._closed = False
         async with self._io_lock("connect"):
-            await asyncio.to_thread(self._connect_sync)
+            await self._run(self._connect_sync)
 
         self.log(
             "Serial(Modbus-RTU) 연결 성공: port=%s baud=%s parity=%s stopbits=%s (unit=%s)",
@@ -185,10 +484,28 @@ class AsyncPLC:
             self._hb_task = None
 
         async with self._io_lock("close"):
-            await asyncio.to_thread(self._close_sync)
+            await self._run(self._close_sync)
+
+        ex, self._exec = self._exec, None
+        if ex is not None:
+            ex.shutdown(wait=False)
 
         self.log("Serial(Modbus-RTU) 연결 종료")
 
+    async def _run(self, func, /, *args, **kwargs):
+        """동기 호출을 PLC 전용 executor(워커 1개)로 넘긴다(asyncio.to_thread 대체).
+
+        - 포트 접근은 _IoGate로 이미 직렬화 → 워커 1개면 충분하고, 취소된 뒤에도 돌고 있는
+          이전 호출이 끝나기 전에 다음 호출이 포트를 건드리는 일도 없다
+        - 기본 executor를 다른 to_thread 사용자와 나눠 쓰지 않음
+        - contextvars 복사 없음(pymodbus/pyserial 호출은 컨텍스트 변수를 읽지 않음)
+        """
+        ex = self._exec
+        if ex is None:
+            ex = self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"plc-{self.cfg.port}")
+        call = functools.partial(func, *args, **kwargs) if (args or kwargs) else func
+        return await asyncio.get_running_loop().run_in_executor(ex, call)
+
     def is_connected(self) -> bool:
         try:
             return bool(self._client) and bool(getattr(self._client, "connected", False))
@@ -207,8 +524,7 @@ class AsyncPLC:
     # --------------------------
     def _connect_sync(self) -> None:
         if self._client is None:
-            sig = inspect.signature(ModbusSerialClient)
-            params = sig.parameters
+            params = _client_params(ModbusSerialClient)
 
             args = []
             kwargs = {}
@@ -254,22 +570,25 @@ class AsyncPLC:
         if not self._client.connect():
             raise RuntimeError("Modbus RTU(RS-232) 연결 실패")
 
-        self._last_io_ts = time.monotonic()
-
-        # device_id/slave/unit 키워드 자동 판별(한 번만)
-        if self._uid_kw is None:
+        # Linux(FTDI 등 USB-serial): 드라이버 기본 16ms 폴링 → low-latency 모드로 왕복 지연 단축
+        #  - 새로 열린 포트에만 1번 적용. Windows/미지원 드라이버는 조용히 무시
+        port = getattr(self._client, "socket", None)
+        if port is not None and port is not self._ll_port:
+            self._ll_port = port
+            self._rtu_dirty = True
             try:
-                sig = inspect.signature(self._client.write_coil)
-                if "device_id" in sig.parameters:
-                    self._uid_kw = "device_id"
-                elif "slave" in sig.parameters:
-                    self._uid_kw = "slave"
-                elif "unit" in sig.parameters:
-                    self._uid_kw = "unit"
-                else:
-                    self._uid_kw = None
+                port.set_low_latency_mode(True)
             except Exception:
-                self._uid_kw = None
+                pass
+
+        self._last_io_ns = _mono_ns()
+
+        # device_id/slave/unit 키워드 자동 판별(클래스당 1번만 inspect, 이후 캐시)
+        self._uid_kw = _uid_kw_for(type(self._client))
+        self._uid_kw_cached = {self._uid_kw: self.cfg.unit} if self._uid_kw else {}
+        # _call()이 매번 getattr(bound method 생성)하지 않도록 클라이언트 메서드를 미리 묶어 둔다
+        client = self._client
+        self._ops = {name: getattr(client, name) for name in _CLIENT_OPS}
 
     def _close_sync(self) -> None:
         if self._client is not None:
@@ -278,11 +597,14 @@ class AsyncPLC:
             except Exception:
                 pass
         self._client = None
+        # 다음 connect에서 새 클라이언트 기준으로 다시 만든다(이전 unit/키워드/메서드가 남지 않게)
+        self._uid_kw_cached = {}
+        self._ops = {}
 
-    def _uid_kwargs(self) -> dict:
-        if self._uid_kw:
-            return {self._uid_kw: self.cfg.unit}
-        return {}
+    def _needs_connect(self) -> bool:
+        """재연결이 실제로 필요할 때만 True(정상 상태에서는 스레드 hop 없이 바로 I/O)."""
+        c = self._client
+        return c is None or not getattr(c, "connected", False)
 
     def _ensure_ok(self, resp):
         if resp is None:
@@ -293,7 +615,42 @@ class AsyncPLC:
             raise ModbusException(str(resp))
         return resp
 
+    def _store_bits(self, start: int, bits) -> None:
+        """읽기/쓰기로 확인된 코일 값을 시각과 함께 캐시(read_bit_cached용)."""
+        now = _mono_ns()
+        cache = self._bit_cache
+        for i, b in enumerate(bits, start):
+            cache[i] = (bool(b), now)
+
+    def _raw_port(self):
+        """직접 프레임을 쓸 수 있는 pyserial 객체(없으면 None → pymodbus 경로)."""
+        ser = getattr(self._client, "socket", None)
+        if ser is None or not hasattr(ser, "read") or not hasattr(ser, "write"):
+            return None
+        return ser
+
+    async def _rtu_write_single(self, ser, fc: int, addr: int, value: int) -> None:
+        """FC05/FC06: 송신 + 에코 응답 수신을 executor에서 한 번에(락 안에서 호출)."""
+        adu = _rtu_adu(self.cfg.unit, fc, addr, value)
+        flush_input = self._rtu_dirty
+        self._rtu_dirty = True
+        reply = await self._run(_rtu_exchange, ser, adu, flush_input)
+        if reply == adu:
+            self._rtu_dirty = False
+            return
+        if _rtu_is_exc_reply(reply, fc):
+            self._rtu_dirty = False
+            raise ModbusException(f"Modbus ExceptionResponse: fc={fc} code={reply[2]}")
+        if not reply:
+            raise ModbusException("응답 없음(timeout)")
+        raise ModbusException(f"응답 불일치: tx={adu.hex()} rx={reply.hex()}")
+
     def _is_reset_err(self, e: Exception) -> bool:
+        # TimeoutError 등 일반 OSError는 리셋이 아님 → 재연결·재시도(비멱등 쓰기 중복) 하지 않음
+        if isinstance(e, SerialTimeoutException):
+            return False
+        if isinstance(e, (SerialException, ConnectionError)):
+            return True
         s = str(e).lower()
         return ("10054" in s) or ("reset by peer" in s) or ("connectionreseterror" in s)
 
@@ -303,60 +660,82 @@ class AsyncPLC:
     @asynccontextmanager
     async def _io_lock(self, op: str, **meta):
         """I/O 직렬화 + 디버깅(락 대기/임계구역 IO 시간 경고). meta에 addr/count 등 확장 가능."""
-        loop = asyncio.get_running_loop()
-        t0 = loop.time()
+        t0 = _mono_ns()
 
-        await self._lock.acquire()
-        try:
-            waited_ms = (loop.time() - t0) * 1000.0
+        # 락이 비어 있으면 남은 프레임 간격은 락 밖에서 먼저 잔다(임계구역 단축).
+        # 락이 잡혀 있으면 어차피 기다리므로 건너뛰고, 부족분은 락 안 _throttle()이 채운다.
+        if not self._lock.locked():
+            gap = self._gap_ns - (t0 - self._last_io_ns)
+            if gap > 0:
+                await asyncio.sleep(gap / 1e9)
 
-            addr = meta.get("addr", None)
-            count = meta.get("count", None)
-            extra = []
-            if addr is not None:
-                extra.append(f"addr={addr}")
-            if count is not None:
-                extra.append(f"count={count}")
-            extra_s = (" [" + ", ".join(extra) + "]") if extra else ""
+        if not self._lock.try_acquire():
+            await self._lock.acquire()
+        try:
+            if not self._log_enabled:
+                yield
+                return
 
-            if waited_ms >= self.cfg.lock_warn_ms:
-                self.log("WARN lock-wait %.0f ms (op=%s)%s", waited_ms, op, extra_s)
+            t_in = _mono_ns()
+            waited_ns = t_in - t0
+            if waited_ns >= self._lock_warn_ns:
+                self.log("WARN lock-wait %.0f ms (op=%s)%s", waited_ns / 1e6, op, _meta_str(meta))
 
-            t_in = loop.time()
             yield
-            io_ms = (loop.time() - t_in) * 1000.0
-            if io_ms >= self.cfg.io_warn_ms:
-                self.log("WARN in-lock IO %.0f ms (op=%s)%s", io_ms, op, extra_s)
+            io_ns = _mono_ns() - t_in
+            if io_ns >= self._io_warn_ns:
+                self.log("WARN in-lock IO %.0f ms (op=%s)%s", io_ns / 1e6, op, _meta_str(meta))
         finally:
             self._lock.release()
 
-    async def _throttle_and_heartbeat(self) -> None:
-        now = time.monotonic()
-        delta = now - self._last_io_ts
-
-        if delta < self.cfg.inter_cmd_gap_s:
-            await asyncio.sleep(self.cfg.inter_cmd_gap_s - delta)
-
-        if (delta > self.cfg.heartbeat_s) and (not self._hb_paused) and (self._client is not None):
-            try:
-                await asyncio.to_thread(self._client.read_coils, 0, 1, **self._uid_kwargs())
-            except Exception:
-                pass
+    async def _throttle(self) -> None:
+        """RTU 프레임 간 최소 간격(inter_cmd_gap_s)만 보장한다.
 
-        self._last_io_ts = time.monotonic()
+        - 간격 대기는 버스 규칙이라 락 안에서 해야 한다(밖에서 자면 다른 작업이 끼어들어 간격이 깨짐).
+          대신 _io_lock이 락을 잡기 전에 남은 간격을 먼저 자고 오므로, 보통은 여기서 바로 통과한다.
+        - heartbeat 핑은 _heartbeat_loop 전담(여기서 추가 핑을 보내면 I/O 한 번이 2프레임이 됨)
+        """
+        now = _mono_ns()
+        gap = self._gap_ns - (now - self._last_io_ns)
+        if gap > 0:
+            await asyncio.sleep(gap / 1e9)
+            now = _mono_ns()
+        self._last_io_ns = now
 
     async def _heartbeat_loop(self) -> None:
         try:
+            period = max(1.0, self._hb_s / 3.0)
+            period_ns = int(period * 1e9)
+            delay = period
             while not self._closed:
-                await asyncio.sleep(max(1.0, self.cfg.heartbeat_s / 3.0))
+                await asyncio.sleep(delay)
+                delay = period
                 if self._closed or self._hb_paused:
                     continue
+                # 최근에 실제 I/O가 있었으면 링크가 살아있는 것 → 핑 생략하고,
+                # 그 I/O 기준으로 period가 지나는 시점까지만 다시 잔다(유휴가 period 되는 순간 바로 핑)
+                idle = _mono_ns() - self._last_io_ns
+                if idle < period_ns:
+                    delay = (period_ns - idle) / 1e9
+                    continue
                 try:
-                    async with self._io_lock("heartbeat", addr=0):
-                        if self._client is None:
+                    async with self._io_lock("heartbeat", addr=_HB_START, count=_HB_COUNT):
+                        if self._closed:
+                            continue
+                        if self._needs_connect():
+                            # 끊긴 상태면 핑 대신 재연결(다음 실제 명령이 재연결 지연을 떠안지 않게)
+                            await self._run(self._connect_sync)
+                            self.log("PLC 재연결 성공(heartbeat)")
                             continue
-                        await asyncio.to_thread(self._client.read_coils, 0, 1, **self._uid_kwargs())
-                        self._last_io_ts = time.monotonic()
+                        await self._throttle()
+                        # 어차피 1프레임 보내는 김에 HMI 상태 코일 블록을 통째로 읽어 캐시 갱신
+                        try:
+                            resp = await self._call("read_coils", _HB_START, _HB_COUNT)
+                        except Exception as e:
+                            if self._is_reset_err(e):
+                                await self._run(self._close_sync)  # 다음 주기에 재연결
+                            raise
+                        self._store_bits(_HB_START, resp.bits[:_HB_COUNT])
                 except Exception:
                     continue
         except asyncio.CancelledError:
@@ -374,17 +753,11 @@ class AsyncPLC:
     # --------------------------
     # name/address parsing
     # --------------------------
-    def _build_synonyms(self) -> Dict[str, str]:
+    @staticmethod
+    def _build_synonyms() -> Dict[str, str]:
         syn: Dict[str, str] = {}
 
-        def norm(s: str) -> str:
-            return (
-                s.strip().upper()
-                .replace(" ", "")
-                .replace("_", "")
-                .replace("-", "")
-                .replace("/", "")
-            )
+        norm = _norm
 
         for k in PLC_COIL_MAP.keys():
             syn[norm(k)] = k
@@ -425,223 +798,441 @@ class AsyncPLC:
 
         return syn
 
-    def _parse_m_device_to_coil(self, s: str) -> int:
-        t = s.strip().upper()
-        if not t.startswith("M"):
-            raise ValueError(f"not M device: {s}")
-        return int(t[1:], 16)
-
-    def _parse_d_device_to_reg(self, s: str) -> int:
-        t = s.strip().upper()
-        if not t.startswith("D"):
-            raise ValueError(f"not D device: {s}")
-        num = t[1:]
-        base = 16 if any(c in "ABCDEF" for c in num) else 10
-        return int(num, base)
-
-    def _addr(self, name_or_addr: Any) -> int:
+    @staticmethod
+    def _build_resolved(synonyms: Dict[str, str]) -> Dict[Any, _Resolved]:
+        """맵 키 + 동의어 키 → (addr, kind) 미리 계산(고수준 API는 전부 dict 조회 1번)."""
+        res: Dict[Any, _Resolved] = {}
+        for k, a in PLC_COIL_MAP.items():
+            res[k] = _Resolved(a, "coil")
+        for k, a in PLC_REG_MAP.items():
+            res[k] = _Resolved(a, "reg")
+        for nk, canonical in synonyms.items():
+            res.setdefault(nk, res[canonical])
+        return res
+
+    def _resolve(self, name_or_addr: Any) -> _Resolved:
+        """이름/주소 → (addr, kind). 결과는 입력값 그대로를 키로 캐시한다.
+
+        kind: "coil"(코일 이름/M디바이스) / "reg"(레지스터 이름/D디바이스) / "raw"(숫자 주소 → 호출한 API 기준)
+        """
         if isinstance(name_or_addr, int):
-            return name_or_addr
-
+            return _Resolved(name_or_addr, "raw")
+        hit = self._resolved.get(name_or_addr)
+        if hit is not None:
+            return hit
+        hit = self._resolve_slow(name_or_addr)
+        if len(self._resolved) < _RESOLVE_CACHE_MAX:
+            self._resolved[name_or_addr] = hit
+        return hit
+
+    def _resolve_slow(self, name_or_addr: Any) -> _Resolved:
         key_raw = str(name_or_addr).strip()
         if not key_raw:
             raise ValueError("empty address/name")
 
         if key_raw in PLC_COIL_MAP:
-            return PLC_COIL_MAP[key_raw]
+            return _Resolved(PLC_COIL_MAP[key_raw], "coil")
         if key_raw in PLC_REG_MAP:
-            return PLC_REG_MAP[key_raw]
-
-        nk = (
-            key_raw.upper()
-            .replace(" ", "")
-            .replace("_", "")
-            .replace("-", "")
-            .replace("/", "")
-        )
+            return _Resolved(PLC_REG_MAP[key_raw], "reg")
+
+        nk = _norm(key_raw)
         if nk in self._SYNONYMS:
             canonical = self._SYNONYMS[nk]
             if canonical in PLC_COIL_MAP:
-                return PLC_COIL_MAP[canonical]
+                return _Resolved(PLC_COIL_MAP[canonical], "coil")
             if canonical in PLC_REG_MAP:
-                return PLC_REG_MAP[canonical]
+                return _Resolved(PLC_REG_MAP[canonical], "reg")
 
-        up = key_raw.upper()
-        if up.startswith("M"):
-            return self._parse_m_device_to_coil(up)
-        if up.startswith("D"):
-            return self._parse_d_device_to_reg(up)
+        # M디바이스는 항상 16진, D디바이스는 10진(숫자만) 또는 16진(A~F 포함)
+        head, num = key_raw[:1].upper(), key_raw[1:]
+        if head == "M":
+            return _Resolved(int(num, 16), "coil")
+        if head == "D":
+            try:
+                return _Resolved(int(num, 10), "reg")
+            except ValueError:
+                return _Resolved(int(num, 16), "reg")
 
-        return int(key_raw, 0)
+        return _Resolved(int(key_raw, 0), "raw")
+
+    def _addr(self, name_or_addr: Any) -> int:
+        return self._resolve(name_or_addr).addr
 
     def _is_reg_name(self, name: Any) -> bool:
-        if isinstance(name, int):
-            return False
-        s = str(name).strip()
-        if s in PLC_REG_MAP:
-            return True
-        nk = (
-            s.upper()
-            .replace(" ", "")
-            .replace("_", "")
-            .replace("-", "")
-            .replace("/", "")
-        )
-        if nk in self._SYNONYMS and self._SYNONYMS[nk] in PLC_REG_MAP:
-            return True
-        if s.upper().startswith("D"):
-            return True
-        return False
+        return self._resolve(name).kind == "reg"
 
     # --------------------------
     # low-level I/O
     # --------------------------
+    async def _io(self, op: str, afn, *args, addr: Optional[int] = None, count: Optional[int] = None):
+        """단일 요청 공통 경로: 락 → (필요 시)연결 → throttle → afn(*args).
+
+        연결 리셋 계열 오류면 클라이언트를 닫고 잠깐 쉰 뒤 1번만 재연결·재시도한다
+        (쓰기도 절대값 기록이라 재시도해도 결과가 같음). 그 외 오류는 그대로 올린다.
+        """
+        async with self._io_lock(op, addr=addr, count=count):
+            for attempt in (0, 1):
+                if self._needs_connect():
+                    await self._run(self._connect_sync)
+                # _throttle() 인라인(단일 요청 경로는 코루틴 하나 덜 만들고, 간격이 이미 지났으면 시각만 갱신)
+                now = _mono_ns()
+                gap = self._gap_ns - (now - self._last_io_ns)
+                if gap > 0:
+                    await asyncio.sleep(gap / 1e9)
+                    now = _mono_ns()
+                self._last_io_ns = now
+                try:
+                    return await afn(*args)
+                except Exception as e:
+                    if attempt or self._closed or not self._is_reset_err(e):
+                        raise
+                    self.log("PLC 연결 리셋 감지(op=%s): %s → 재연결 후 1회 재시도", op, e)
+                    await self._run(self._close_sync)
+                    await asyncio.sleep(_RESET_RETRY_S)
+
+    async def _call(self, method: str, *args):
+        """pymodbus 클라이언트 메서드 1회 호출 + 응답 검사(락/throttle은 호출자 책임)."""
+        resp = await self._run(self._ops[method], *args, **self._uid_kw_cached)
+        return self._ensure_ok(resp)
+
     async def read_coil(self, addr: int) -> bool:
-        async with self._io_lock("read_coil", addr=addr):
-            await asyncio.to_thread(self._connect_sync)
-            await self._throttle_and_heartbeat()
-            resp = await asyncio.to_thread(self._client.read_coils, addr, 1, **self._uid_kwargs())
-            self._ensure_ok(resp)
-            return bool(resp.bits[0])
+        resp = await self._io("read_coil", self._call, "read_coils", addr, 1, addr=addr)
+        v = bool(resp.bits[0])
+        self._bit_cache[addr] = (v, _mono_ns())
+        return v
 
     async def read_coils_block(self, start_addr: int, count: int) -> list[bool]:
         start_addr = int(start_addr)
         count = max(1, int(count))
 
-        async with self._io_lock("read_coils_block", addr=start_addr, count=count):
-            await asyncio.to_thread(self._connect_sync)
-            await self._throttle_and_heartbeat()
-            resp = await asyncio.to_thread(self._client.read_coils, start_addr, count, **self._uid_kwargs())
-            self._ensure_ok(resp)
-            bits = list(getattr(resp, "bits", []) or [])
-            if len(bits) < count:
-                bits.extend([False] * (count - len(bits)))
-            return [bool(b) for b in bits[:count]]
+        resp = await self._io("read_coils_block", self._call, "read_coils", start_addr, count, addr=start_addr, count=count)
+        # 응답 bits는 바이트 단위로 패딩돼 count보다 길 수 있음 → 잘라내기/부족분 False를 한 번에
+        raw = getattr(resp, "bits", None) or ()
+        n = len(raw)
+        if n >= count:
+            bits = [bool(b) for b in raw[:count]]
+        else:
+            bits = [bool(b) for b in raw] + [False] * (count - n)
+        self._store_bits(start_addr, bits)
+        return bits
 
     async def write_coil(self, addr: int, value: bool) -> None:
-        async with self._io_lock("write_coil", addr=addr):
-            await asyncio.to_thread(self._connect_sync)
-            await self._throttle_and_heartbeat()
-            resp = await asyncio.to_thread(self._client.write_coil, addr, bool(value), **self._uid_kwargs())
-            self._ensure_ok(resp)
+        await self._io("write_coil", self._write_coil_locked, addr, value, addr=addr)
+
+    async def _write_coil_locked(self, addr: int, value: bool) -> None:
+        """FC05 1프레임(락/throttle은 호출자 책임)."""
+        ser = self._raw_port()
+        if ser is not None:
+            await self._rtu_write_single(ser, 0x05, addr, 0xFF00 if value else 0x0000)
+        else:
+            await self._call("write_coil", addr, bool(value))
+        self._bit_cache[addr] = (bool(value), _mono_ns())
+
+    async def write_coil_verified(self, addr: int, value: bool) -> bool:
+        """FC05 쓰기 후 같은 코일을 다시 읽어 확인(락 1번, 사이에 다른 I/O/heartbeat 안 끼어듦).
+
+        반환: 읽은 값 == value. (PLC 래더가 즉시 되돌리는 인터락 등은 False로 드러난다)
+        """
+        return await self._io("write_coil_verified", self._write_verify_locked, addr, bool(value), addr=addr)
+
+    async def _write_verify_locked(self, addr: int, value: bool) -> bool:
+        await self._write_coil_locked(addr, value)
+        await self._throttle()  # 쓰기 → 읽기 사이에도 프레임 간격 필요
+        resp = await self._call("read_coils", addr, 1)
+        v = bool(resp.bits[0])
+        self._bit_cache[addr] = (v, _mono_ns())
+        return v == value
+
+    async def write_coils_block(self, start_addr: int, values: list[bool]) -> None:
+        """연속 코일을 FC15(Write Multiple Coils) 한 번으로 기록."""
+        start_addr = int(start_addr)
+        values = [bool(v) for v in values]
+        if not values:
+            return
+        if len(values) == 1:
+            # 1개면 FC15보다 FC05가 프레임이 짧고 직접 송신 경로도 탄다
+            await self.write_coil(start_addr, values[0])
+            return
+
+        await self._io("write_coils_block", self._call, "write_coils", start_addr, values, addr=start_addr, count=len(values))
+        self._store_bits(start_addr, values)
 
     async def read_reg(self, addr: int) -> int:
-        async with self._io_lock("read_reg", addr=addr):
-            await asyncio.to_thread(self._connect_sync)
-            await self._throttle_and_heartbeat()
-            resp = await asyncio.to_thread(self._client.read_holding_registers, addr, 1, **self._uid_kwargs())
-            self._ensure_ok(resp)
-            return int(resp.registers[0])
+        resp = await self._io("read_reg", self._call, "read_holding_registers", addr, 1, addr=addr)
+        return int(resp.registers[0])
+
+    async def read_regs_block(self, start_addr: int, count: int) -> list[int]:
+        """연속 holding register를 FC03 한 번으로 읽기(read_coils_block의 레지스터판)."""
+        start_addr = int(start_addr)
+        count = max(1, int(count))
+
+        resp = await self._io("read_regs_block", self._call, "read_holding_registers", start_addr, count, addr=start_addr, count=count)
+        words = getattr(resp, "registers", None) or ()
+        if len(words) < count:
+            raise ModbusException(f"응답 레지스터 부족: {len(words)}/{count}")
+        return [int(w) for w in words[:count]]
 
     async def write_reg(self, addr: int, value: int) -> None:
-        async with self._io_lock("write_reg", addr=addr):
-            await asyncio.to_thread(self._connect_sync)
-            await self._throttle_and_heartbeat()
-            resp = await asyncio.to_thread(self._client.write_register, addr, int(value), **self._uid_kwargs())
-            self._ensure_ok(resp)
+        await self._io("write_reg", self._write_reg_locked, addr, int(value), addr=addr)
+
+    async def _write_reg_locked(self, addr: int, value: int) -> None:
+        """FC06 1프레임(락/throttle은 호출자 책임)."""
+        ser = self._raw_port()
+        if ser is not None:
+            await self._rtu_write_single(ser, 0x06, addr, value)
+        else:
+            await self._call("write_register", addr, value)
+
+    async def write_regs_block(self, start_addr: int, values: list[int]) -> None:
+        """연속 레지스터를 FC16(Write Multiple Registers) 한 번으로 기록."""
+        start_addr = int(start_addr)
+        values = [int(v) for v in values]
+        if not values:
+            return
+
+        await self._io("write_regs_block", self._call, "write_registers", start_addr, values, addr=start_addr, count=len(values))
+
+    async def read_many(self, names: Iterable[Any]) -> Dict[Any, Any]:
+        """여러 코일/레지스터를 주소 묶음별 1회 요청으로 읽어서 {입력 이름: 값} 으로 반환.
+
+        - 코일 → bool, 레지스터 → int
+        - 이름/주소 해석 규칙은 read_bit/read_reg_name과 동일
+        """
+        coils: Dict[Any, int] = {}
+        regs: Dict[Any, int] = {}
+        for n in names:
+            addr, kind = self._resolve(n)
+            if kind == "reg":
+                regs[n] = addr
+            else:
+                coils[n] = addr
+        return await self._read_runs(_group_runs(coils, _COIL_MAX_GAP), _group_runs(regs, _REG_MAX_GAP))
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """PLC_COIL_MAP + PLC_REG_MAP 전체를 읽는다(현재 맵 기준 2회 요청)."""
+        return await self._read_runs(_COIL_RUNS, _REG_RUNS)
+
+    async def _read_runs(self, coil_runs: Tuple[_Run, ...], reg_runs: Tuple[_Run, ...]) -> Dict[Any, Any]:
+        out: Dict[Any, Any] = {}
+        if not coil_runs and not reg_runs:
+            return out
+
+        async with self._io_lock("read_many", count=len(coil_runs) + len(reg_runs)):
+            if self._needs_connect():
+                await self._run(self._connect_sync)
+
+            for start, count, members in coil_runs:
+                await self._throttle()
+                resp = await self._call("read_coils", start, count)
+                bits = resp.bits
+                for key, off in members:
+                    out[key] = bool(bits[off])
+
+            for start, count, members in reg_runs:
+                await self._throttle()
+                resp = await self._call("read_holding_registers", start, count)
+                words = resp.registers
+                for key, off in members:
+                    out[key] = int(words[off])
+
+        return out
 
     # --------------------------
     # high-level helpers
     # --------------------------
     async def pulse(self, addr: int, *, ms: Optional[int] = None) -> None:
-        width = self.cfg.pulse_ms if ms is None else int(ms)
-        await self.write_coil(addr, True)
-        await asyncio.sleep(max(0.01, width / 1000.0))
-        await self.write_coil(addr, False)
+        """ON → width 대기 → OFF를 락 1번 안에서 처리.
 
-    async def write_switch(self, name_or_addr: Any, on: bool, *, momentary: bool = False, pulse_ms: Optional[int] = None) -> None:
-        addr = self._addr(name_or_addr)
+        - 대기 중에도 락을 쥐고 있어 엣지 사이에 다른 I/O가 끼어들지 않음 → 펄스 폭 = pulse_ms
+        - OFF 직전 _throttle()은 폭이 inter_cmd_gap_s보다 짧을 때만 실제로 기다린다(버스 간격 규칙)
+        - 대기 중 취소돼도 OFF는 반드시 보낸다(코일이 ON으로 남지 않게)
+        """
+        width = self._pulse_ms if ms is None else int(ms)
+        async with self._io_lock("pulse", addr=addr):
+            if self._needs_connect():
+                await self._run(self._connect_sync)
+            await self._throttle()
+            await self._write_coil_locked(addr, True)
+            try:
+                await asyncio.sleep(max(0.01, width / 1000.0))
+            finally:
+                await self._throttle()
+                await self._write_coil_locked(addr, False)
 
-        if self._is_reg_name(name_or_addr):
+    async def write_switch(self, name_or_addr: Any, on: bool, *, momentary: bool = False, pulse_ms: Optional[int] = None) -> None:
+        addr, kind = self._resolve(name_or_addr)
+        if kind == "reg":
             raise TypeError(f"write_switch는 COIL 전용입니다. register로 보이는 입력: {name_or_addr}")
+        await self._switch(addr, on, momentary, pulse_ms)
 
+    async def _switch(self, addr: int, on: bool, momentary: bool = False, pulse_ms: Optional[int] = None) -> None:
+        """이미 해석된 코일 주소로 write_switch(고수준 helper는 이름 해석 없이 바로 여기로)."""
         if momentary:
             await self.pulse(addr, ms=pulse_ms)
         else:
             await self.write_coil(addr, bool(on))
 
+    async def write_switches(self, updates: Dict[Any, bool]) -> None:
+        """여러 코일을 락 1번 안에서 설정. 주소가 연속인 것끼리 FC15 1프레임(1개짜리는 FC05)으로 보낸다.
+
+        - {이름/주소: on} 형태, 주소 순으로 전송(같은 묶음은 한 프레임이라 동시에 반영)
+        - 읽고-병합-쓰기는 하지 않는다: 그 사이 PLC 래더가 바꾼 코일을 덮어쓸 수 있으므로
+          요청에 없는 주소가 끼면 묶음을 나눈다
+        """
+        by_addr: Dict[int, bool] = {}
+        for n, on in updates.items():
+            addr, kind = self._resolve(n)
+            if kind == "reg":
+                raise TypeError(f"write_switches는 COIL 전용입니다. register로 보이는 입력: {n}")
+            by_addr[addr] = bool(on)
+        if not by_addr:
+            return
+
+        runs: List[Tuple[int, List[bool]]] = []
+        for addr in sorted(by_addr):
+            if runs and addr == runs[-1][0] + len(runs[-1][1]):
+                runs[-1][1].append(by_addr[addr])
+            else:
+                runs.append((addr, [by_addr[addr]]))
+
+        async with self._io_lock("write_switches", addr=runs[0][0], count=len(by_addr)):
+            if self._needs_connect():
+                await self._run(self._connect_sync)
+            for start, values in runs:
+                await self._throttle()
+                if len(values) == 1:
+                    await self._write_coil_locked(start, values[0])
+                else:
+                    await self._call("write_coils", start, values)
+                    self._store_bits(start, values)
+
     async def read_bit(self, name_or_addr: Any) -> bool:
-        addr = self._addr(name_or_addr)
-        if self._is_reg_name(name_or_addr):
+        addr, kind = self._resolve(name_or_addr)
+        if kind == "reg":
             raise TypeError(f"read_bit은 COIL 전용입니다. register로 보이는 입력: {name_or_addr}")
         return bool(await self.read_coil(addr))
 
+    async def read_bit_cached(self, name_or_addr: Any, max_age_s: float = 0.2) -> bool:
+        """최근 max_age_s 이내에 읽거나 쓴 값이 있으면 버스 접근 없이 반환, 없으면 read_bit."""
+        addr, kind = self._resolve(name_or_addr)
+        if kind == "reg":
+            raise TypeError(f"read_bit은 COIL 전용입니다. register로 보이는 입력: {name_or_addr}")
+        hit = self._bit_cache.get(addr)
+        if hit is not None and _mono_ns() - hit[1] < max_age_s * 1e9:
+            return hit[0]
+        return bool(await self.read_coil(addr))
+
     async def read_reg_name(self, name_or_addr: Any) -> int:
-        addr = self._addr(name_or_addr)
+        addr, kind = self._resolve(name_or_addr)
+        if kind == "coil":
+            raise TypeError(f"read_reg_name은 REGISTER 전용입니다. coil로 보이는 입력: {name_or_addr}")
         return int(await self.read_reg(addr))
 
     async def write_reg_name(self, name_or_addr: Any, value: int) -> None:
-        addr = self._addr(name_or_addr)
+        addr, kind = self._resolve(name_or_addr)
+        if kind == "coil":
+            raise TypeError(f"write_reg_name은 REGISTER 전용입니다. coil로 보이는 입력: {name_or_addr}")
         await self.write_reg(addr, int(value))
 
     # --------------------------------------------------
     # 고수준 API(너 기존 그대로)
     # --------------------------------------------------
-    async def rp(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("RP", on, momentary=momentary)
-    async def rv(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("RV", on, momentary=momentary)
-    async def fv(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("FV", on, momentary=momentary)
-    async def mv(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("MV", on, momentary=momentary)
-    async def vv(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("V/V", on, momentary=momentary)
-    async def tmp(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("TMP", on, momentary=momentary)
-
-    async def air(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("AIR", on, momentary=momentary)
-    async def water(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("WATER", on, momentary=momentary)
-    async def gas1(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("G1", on, momentary=momentary)
-    async def gas2(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("G2", on, momentary=momentary)
-
-    async def shutter1(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("SHUTTER1", on, momentary=momentary)
-    async def shutter2(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("SHUTTER2", on, momentary=momentary)
-    async def main_shutter(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("MAINSHUTTER", on, momentary=momentary)
-    async def ftm(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("FTM", on, momentary=momentary)
-
-    async def power1(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("POWER1", on, momentary=momentary)
-    async def power2(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("POWER2", on, momentary=momentary)
-    async def door(self, on: bool = True, *, momentary: bool = False) -> None: await self.write_switch("DOOR", on, momentary=momentary)
+    async def rp(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_R_P_SW, on, momentary)
+    async def rv(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_R_V_SW, on, momentary)
+    async def fv(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_F_V_SW, on, momentary)
+    async def mv(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_M_V_SW, on, momentary)
+    async def vv(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_V_V_SW, on, momentary)
+    async def tmp(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_TMP_SW, on, momentary)
+
+    async def air(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_AIR_SW, on, momentary)
+    async def water(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_WATER_SW, on, momentary)
+    async def gas1(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_GAS_1_SW, on, momentary)
+    async def gas2(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_GAS_2_SW, on, momentary)
+
+    async def shutter1(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_SHUTTER_1_SW, on, momentary)
+    async def shutter2(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_SHUTTER_2_SW, on, momentary)
+    async def main_shutter(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_MAIN_SHUTTER_SW, on, momentary)
+    async def ftm(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_FTM_SW, on, momentary)
+
+    async def power1(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_POWER_1_SW, on, momentary)
+    async def power2(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_POWER_2_SW, on, momentary)
+    async def door(self, on: bool = True, *, momentary: bool = False) -> None: await self._switch(PLC_COIL_DOOR_SW, on, momentary)
+
+    def _dac_range(self) -> Tuple[int, int]:
+        """DAC 코드 클램프 범위(lo, hi) = (offset, offset+fs). 1번 계산해 캐시.
+
+        raw 코드 쓰기(set_dac_power/set_dac_both)는 이 범위만 필요 → 전류 범위 설정은 보지 않는다.
+        잘못된 설정이면 캐시하지 않고 매 호출 ValueError.
+        """
+        rng = self._dac_range_cache
+        if rng is not None:
+            return rng
 
-    def _clamp_dac_code(self, code: int) -> int:
         fs = int(self.cfg.dac_full_scale_code)
         if fs <= 0:
             raise ValueError(f"dac_full_scale_code must be > 0 (now={fs})")
-
         offset = int(self.cfg.dac_offset_code)
-        lo, hi = offset, offset + fs  # ✅ offset 포함 범위
+        rng = (offset, offset + fs)  # ✅ offset 포함 범위
+        self._dac_range_cache = rng
+        return rng
 
-        c = int(code)
-        if c < lo:
-            c = lo
-        elif c > hi:
-            c = hi
-        return c
+    def _dac_params(self) -> Tuple[float, float, int, int]:
+        """전류→코드 직선을 (slope, intercept, lo, hi)로 1번 계산해 캐시한다(set_dac_current 전용).
 
-    async def set_dac_power(self, ch: int, code: int) -> None:
-        key = "DAC_POWER_1" if int(ch) == 1 else "DAC_POWER_2" if int(ch) == 2 else None
-        if key is None:
+        code = ma*slope + intercept (4~20mA → offset..offset+fs 직선), lo/hi는 코드 클램프 범위.
+        잘못된 설정이면 캐시하지 않고 매 호출 ValueError.
+        """
+        sc = self._dac_scale
+        if sc is not None:
+            return sc
+
+        lo, hi = self._dac_range()
+        mn = float(self.cfg.dac_current_min_ma)
+        mx = float(self.cfg.dac_current_max_ma)
+        if mx <= mn:
+            raise ValueError(f"Invalid current range: {mn}..{mx}")
+
+        slope = (hi - lo) / (mx - mn)
+        sc = (slope, lo - mn * slope, lo, hi)
+        self._dac_scale = sc
+        return sc
+
+    def _clamp_dac_code(self, code: int) -> int:
+        lo, hi = self._dac_range()
+        return min(hi, max(lo, int(code)))
+
+    @staticmethod
+    def _dac_addr(ch: int) -> int:
+        ch = int(ch)
+        addr = PLC_REG_DAC_POWER_1 if ch == 1 else PLC_REG_DAC_POWER_2 if ch == 2 else None
+        if addr is None:
             raise ValueError("DAC channel must be 1 or 2")
+        return addr
 
+    async def set_dac_power(self, ch: int, code: int) -> None:
+        addr = self._dac_addr(ch)
         # ✅ 안전: 범위 강제
-        await self.write_reg_name(key, self._clamp_dac_code(code))
+        await self.write_reg(addr, self._clamp_dac_code(code))
+
+    async def set_dac_both(self, code1: int, code2: int) -> Tuple[int, int]:
+        """DAC 1/2 코드를 FC16 한 프레임으로 동시에 기록(D00000/D00001 연속). 실제 기록값 반환."""
+        c1 = self._clamp_dac_code(code1)
+        c2 = self._clamp_dac_code(code2)
+        await self.write_regs_block(PLC_REG_DAC_POWER_1, [c1, c2])
+        return c1, c2
 
     async def set_dac_current(self, ch: int, ma: float) -> int:
         """
         4~20mA(Current) → DAC 코드로 변환해서 D00000/D00001에 기록
         """
-        mn = float(self.cfg.dac_current_min_ma)
-        mx = float(self.cfg.dac_current_max_ma)
-        if mx <= mn:
-            raise ValueError(f"Invalid current range: {mn}..{mx}")
+        addr = self._dac_addr(ch)
+        slope, intercept, lo, hi = self._dac_params()
+        # 코드 범위 클램프 = 전류 범위 클램프(직선이므로)
+        code = min(hi, max(lo, int(round(float(ma) * slope + intercept))))
 
-        i = float(ma)
-        if i < mn:
-            i = mn
-        elif i > mx:
-            i = mx
-
-        x = (i - mn) / (mx - mn)  # 0..1
-        fs = int(self.cfg.dac_full_scale_code)
-        offset = int(self.cfg.dac_offset_code)
+        await self.write_reg(addr, code)
+        return code
 
-        code = int(round(x * fs)) + offset
-        code = self._clamp_dac_code(code)
 
-        await self.set_dac_power(ch, code)
-        return code
+AsyncPLC._SYNONYMS = AsyncPLC._build_synonyms()
+AsyncPLC._RESOLVED_BASE = AsyncPLC._build_resolved(AsyncPLC._SYNONYMS)
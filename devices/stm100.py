@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from utils.base_serial import BaseSerialDevice, SerialDeviceError
@@ -18,6 +19,10 @@ class STM100CommandError(SerialDeviceError):
 
 STX = 0x02  # Start of Text
 
+# 프레임 조립용 고정 조각: STX+LEN 접두(LEN 1~10), CHK 1바이트
+_PREFIX = tuple(bytes((STX, n)) for n in range(11))
+_CHK = tuple(bytes((i,)) for i in range(256))
+
 _OK_CODES = {"A", "B"}
 _CODE_MEANING = {
     "A": "OK (No reset)",
@@ -36,55 +41,66 @@ def checksum_data_only(data: bytes) -> int:
     return sum(data) & 0xFF
 
 
+@lru_cache(maxsize=64)
 def build_frame(data_ascii: str) -> bytes:
     """
     STX(1) + LEN(1) + DATA(LEN) + CHK(1)
     DATA는 ASCII 1~10 bytes
+
+    - 폴링 명령("S", "T", "A?" 등)은 매번 같은 문자열 → 완성된 프레임(bytes, 불변)을 캐시해서 재사용
+    - ValueError는 캐시되지 않는다(lru_cache는 정상 반환값만 저장)
     """
     data = data_ascii.encode("ascii", errors="replace")
-    if not (1 <= len(data) <= 10):
-        raise ValueError("STM-100 DATA는 1~10 bytes(ASCII) 이어야 합니다.")
     ln = len(data)
-    chk = checksum_data_only(data)
-    return bytes([STX, ln]) + data + bytes([chk])
+    if not (1 <= ln <= 10):
+        raise ValueError("STM-100 DATA는 1~10 bytes(ASCII) 이어야 합니다.")
+    return _PREFIX[ln] + data + _CHK[checksum_data_only(data)]
 
 
 def read_frame(ser, timeout_s: float) -> Tuple[str, bool]:
     """
     STX 찾기 -> LEN -> DATA -> CHK
+
+    - STX는 1바이트씩 읽지 않고, 들어와 있는 만큼(in_waiting) 한 번에 읽어 find로 찾는다.
+    - STX 뒤에 이미 읽힌 바이트는 그대로 쓰고, 모자란 LEN/DATA/CHK만 추가로 읽는다.
     """
-    t0 = time.time()
+    # 루프/단계마다 반복되는 속성 조회를 지역 변수로(LOAD_FAST)
+    monotonic_ns = time.monotonic_ns
+    ser_read = ser.read
+    deadline = monotonic_ns() + int(timeout_s * 1_000_000_000)
+    buf = bytearray()
 
     # STX 찾기
-    while time.time() - t0 < timeout_s:
-        b = ser.read(1)
-        if not b:
-            continue
-        if b[0] == STX:
+    while True:
+        idx = buf.find(STX)
+        if idx >= 0:
+            del buf[: idx + 1]
             break
-    else:
-        raise TimeoutError("STM-100: STX timeout")
+        buf.clear()
+        if monotonic_ns() >= deadline:
+            raise TimeoutError("STM-100: STX timeout")
+        buf += ser_read(max(1, ser.in_waiting))
 
     # LEN
-    ln_b = ser.read(1)
-    if not ln_b:
-        raise TimeoutError("STM-100: LEN timeout")
-    ln = ln_b[0]
+    if not buf:
+        buf += ser_read(1)
+        if not buf:
+            raise TimeoutError("STM-100: LEN timeout")
+    ln = buf[0]
     if not (1 <= ln <= 10):
         raise STM100ProtocolError(f"STM-100: invalid LEN={ln}")
 
-    # DATA
-    data_b = ser.read(ln)
-    if len(data_b) != ln:
+    # DATA + CHK (남은 바이트를 한 번에)
+    need = ln + 2 - len(buf)
+    if need > 0:
+        buf += ser_read(need)
+    if len(buf) < ln + 1:
         raise TimeoutError("STM-100: DATA timeout")
-
-    # CHK
-    chk_b = ser.read(1)
-    if not chk_b:
+    if len(buf) < ln + 2:
         raise TimeoutError("STM-100: CHK timeout")
-    chk = chk_b[0]
 
-    ok = (checksum_data_only(data_b) == chk)
+    data_b = bytes(buf[1 : ln + 1])
+    ok = (checksum_data_only(data_b) == buf[ln + 1])
     payload = data_b.decode("ascii", errors="replace")
     return payload, ok
 
@@ -104,6 +120,15 @@ class STM100(BaseSerialDevice):
       예)  "T", "A?", "A!", "E=1.23"
     """
 
+    def __init__(self, *, reset_io_each_tx: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        # 송신 전 입출력 버퍼 reset 정책(ACS2000과 동일)
+        #  - 정상 교환 뒤에는 버퍼에 남는 바이트가 없으므로 reset(syscall 2회)을 생략한다.
+        #  - timeout/프레임 오류/체크섬 불일치 뒤에만 _rx_dirty로 표시해 다음 송신 전에 1번 reset
+        #  - reset_io_each_tx=True면 기존처럼 매 송신마다 reset
+        self._reset_io_each_tx = reset_io_each_tx
+        self._rx_dirty = True
+
     def exchange(self, cmd: str, timeout_s: float = 1.0) -> STMReply:
         cmd = cmd.strip()
         if not cmd:
@@ -113,12 +138,21 @@ class STM100(BaseSerialDevice):
 
         with self._lock:
             ser = self._require()
-            ser.reset_input_buffer()
-            ser.reset_output_buffer()
-            ser.write(tx)
-            ser.flush()
-
-            payload, chk_ok = read_frame(ser, timeout_s=timeout_s)
+            if self._reset_io_each_tx or self._rx_dirty:
+                ser.reset_input_buffer()
+                ser.reset_output_buffer()
+                self._rx_dirty = False
+            try:
+                # flush()(tcdrain) 생략: 13바이트 이하 프레임은 write 시점에 송신 큐에 다 들어가고,
+                #  이어지는 read_frame이 응답을 기다리므로 송신 완료가 자연히 보장된다.
+                ser.write(tx)
+
+                payload, chk_ok = read_frame(ser, timeout_s=timeout_s)
+            except Exception:
+                self._rx_dirty = True
+                raise
+            if not chk_ok:
+                self._rx_dirty = True
 
         if not chk_ok:
             raise STM100ProtocolError(f"STM-100 checksum mismatch. rx={payload!r}")
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import sys
+import threading
+import traceback
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # ✅ 어디서 실행하든(import 깨짐 방지) 가장 먼저 보정
 _BASE_DIR = Path(__file__).resolve().parent
@@ -10,13 +13,15 @@ if str(_BASE_DIR) not in sys.path:
     sys.path.insert(0, str(_BASE_DIR))
 
 from PySide6.QtWidgets import QApplication, QWidget, QMessageBox, QDialog
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal
 
 from ui.mainWindow import Ui_Form
-from ui.config_dialog import ConfigDialog
-from config.plc_config import load_plc_settings
-from controller.hmi_plc_binder import HmiPlcBinder
-from utils.device_manager import DeviceManager
+
+# 무거운 모듈(PLC 바인더/pymodbus, 시리얼 장비, Config 창)은 실제로 쓰는 시점에 import
+#  → 첫 창이 뜨기 전에 도는 모듈 초기화를 줄인다. 타입 힌트용으로만 여기서 참조.
+if TYPE_CHECKING:
+    from controller.hmi_plc_binder import HmiPlcBinder
+    from utils.device_manager import DeviceManager
 
 
 # 하얀색 "일반 버튼" (초록/체크 상태 없음)
@@ -41,6 +46,8 @@ QPushButton:disabled {
 
 
 class HmiWindow(QWidget):
+    sig_reconnect_done = Signal(object)  # list[str] (재연결 실패 메시지)
+
     def __init__(self):
         super().__init__()
         self.ui = Ui_Form()
@@ -56,6 +63,11 @@ class HmiWindow(QWidget):
         self._ini_path = _BASE_DIR / "config" / "devices.ini"
         self._plc_binder: HmiPlcBinder | None = None
         self._dev_mgr: DeviceManager | None = None
+        self._reconnecting = False
+        self._reconnect_thread: threading.Thread | None = None
+
+        # 백그라운드 재연결 결과는 GUI 스레드에서 받아 팝업(queued connection)
+        self.sig_reconnect_done.connect(self._on_reconnect_done)
 
         # Process 버튼: Process 창 앞으로
         self.ui.processBtn.clicked.connect(self.goto_process_window)
@@ -74,7 +86,16 @@ class HmiWindow(QWidget):
         self.process_window.raise_()
         self.process_window.activateWindow()
 
-    def set_runtime_objects(self, plc_binder: HmiPlcBinder, dev_mgr: DeviceManager, ini_path: Path) -> None:
+    def start_plc_binder(self, plc_settings) -> None:
+        """PLC 바인더 생성 + 시작(앱 종료 시 stop 연결)."""
+        from controller.hmi_plc_binder import HmiPlcBinder
+
+        binder = HmiPlcBinder(self.ui, plc_settings)
+        binder.start()
+        QApplication.instance().aboutToQuit.connect(binder.stop)
+        self._plc_binder = binder
+
+    def set_runtime_objects(self, plc_binder: HmiPlcBinder | None, dev_mgr: DeviceManager | None, ini_path: Path) -> None:
         """main()에서 만든 런타임 객체 주입(PLC/STM/ACS 재연결에 사용)"""
         self._plc_binder = plc_binder
         self._dev_mgr = dev_mgr
@@ -82,6 +103,8 @@ class HmiWindow(QWidget):
 
     def open_config_dialog(self) -> None:
         """Config 팝업 → Save(=Accepted)면 즉시 3개 장비 재연결"""
+        from ui.config_dialog import ConfigDialog
+
         dlg = ConfigDialog(ini_path=self._ini_path, parent=self)
         ret = dlg.exec()
 
@@ -91,24 +114,68 @@ class HmiWindow(QWidget):
             self._apply_config_and_reconnect()
 
     def _apply_config_and_reconnect(self) -> None:
+        if self._reconnecting:
+            return
         errors: list[str] = []
 
-        # 1) PLC 재연결(워커 재시작)
+        # 1) PLC 재연결(워커 재시작) - QThread 생성/시작은 GUI 스레드에서
         try:
+            from config.plc_config import load_plc_settings
+
+            new_plc_settings = load_plc_settings(self._ini_path)
             if self._plc_binder:
-                new_plc_settings = load_plc_settings(self._ini_path)
                 self._plc_binder.reload_settings(new_plc_settings)
+            else:
+                # 시작 때 설정 오류로 PLC를 못 띄운 경우 → 고친 설정으로 지금 시작
+                self.start_plc_binder(new_plc_settings)
         except Exception as e:
             errors.append(f"PLC reconnect failed: {e}")
 
         # 2) STM/ACS 재연결(ini 재로딩 + connect)
+        #  - 시리얼 open이 수백 ms씩 걸릴 수 있으므로 백그라운드 스레드에서 → UI 멈춤 없음
+        #  - 끝나면 sig_reconnect_done으로 결과 팝업
+        self._reconnecting = True
+        if hasattr(self.ui, "configBtn"):
+            self.ui.configBtn.setEnabled(False)
+        t = threading.Thread(
+            target=self._reconnect_devices, args=(errors,), name="device-reconnect", daemon=True
+        )
+        self._reconnect_thread = t
+        t.start()
+
+    def _reconnect_devices(self, errors: list[str]) -> None:
+        """(백그라운드 스레드) STM/ACS 재연결 후 결과를 시그널로 GUI에 전달."""
         try:
             if self._dev_mgr:
                 dev_errs = self._dev_mgr.reload_from_ini(self._ini_path, connect=True)
-                for k, v in dev_errs.items():
-                    errors.append(f"{k}: {v}")
+            else:
+                # 시작 때 설정 오류로 매니저를 못 만든 경우 → 고친 설정으로 지금 생성
+                from utils.device_manager import DeviceManager
+
+                dev_mgr = DeviceManager.from_ini(self._ini_path)
+                dev_errs = dev_mgr.connect_all()
+                self._dev_mgr = dev_mgr
+            for k, v in dev_errs.items():
+                errors.append(f"{k}: {v}")
         except Exception as e:
             errors.append(f"STM/ACS reconnect failed: {e}")
+        self.sig_reconnect_done.emit(errors)
+
+    def close_devices(self) -> None:
+        """앱 종료 시 STM/ACS 닫기. 진행 중인 백그라운드 재연결이 있으면 끝난 뒤에 닫는다
+        (connect와 close_all이 동시에 포트를 만지지 않게)."""
+        t = self._reconnect_thread
+        if t is not None and t.is_alive():
+            t.join(5.0)
+        if self._dev_mgr:
+            self._dev_mgr.close_all()
+
+    def _on_reconnect_done(self, errors: list[str]) -> None:
+        self._reconnect_thread = None
+
+        self._reconnecting = False
+        if hasattr(self.ui, "configBtn"):
+            self.ui.configBtn.setEnabled(True)
 
         if errors:
             QMessageBox.warning(self, "Reconnect", "일부 장비 재연결 실패:\n" + "\n".join(errors))
@@ -169,33 +236,69 @@ class ProcessWindow(QWidget):
         event.accept()
 
 
-def main():
-    app = QApplication(sys.argv)
+def _start_runtime(app: QApplication, hmi: HmiWindow) -> None:
+    """PLC 바인딩 + STM/ACS 연결. 첫 화면이 뜬 뒤(이벤트 루프 시작 직후)에 호출된다.
 
-    hmi = HmiWindow()
-    proc = ProcessWindow()
+    무거운 모듈(PLC 바인더/pymodbus, 시리얼 장비) import와 포트 open을 여기로 미뤄
+    창이 먼저 그려지게 한다.
+    """
+    from config._ini_cache import ConfigValidationError
+    from config.plc_config import load_plc_settings
+    from utils.device_manager import DeviceManager
 
     # ------------------------------
     # PLC 바인딩 시작
     # ------------------------------
     ini_path = _BASE_DIR / "config" / "devices.ini"
-    plc_settings = load_plc_settings(ini_path)
+    try:
+        plc_settings = load_plc_settings(ini_path)
+    except ConfigValidationError as e:
+        # 잘못된 PLC 설정 → 앱은 띄워 두고 알림(Config 창에서 고쳐 저장하면 그때 시작)
+        plc_settings = None
+        QMessageBox.critical(hmi, "PLC Config", f"devices.ini PLC 설정 오류로 PLC 연결을 시작하지 않았습니다.\n{e}")
 
     # ✅ STM/ACS 매니저 생성 및 최초 연결(실패해도 프로그램은 유지)
-    dev_mgr = DeviceManager.from_ini(ini_path)
-    dev_errors = dev_mgr.connect_all()  # 실패한 것만 dict로 옴
-    if dev_errors:
-        # 필요하면 여기서 QMessageBox로 알려도 됨(원하면)
-        pass
+    #  - [stm100]/[acs2000] 설정 오류(섹션 없음/값 오류)면 알리고 매니저 없이 진행
+    #    → Config 창에서 고쳐 저장하면 재연결 경로에서 새로 만든다. PLC 시작과는 무관.
+    try:
+        dev_mgr = DeviceManager.from_ini(ini_path)  # 객체 생성만(포트 open은 아래 connect_all)
+    except Exception as e:
+        dev_mgr = None
+        QMessageBox.critical(hmi, "Device Config", f"devices.ini STM/ACS 설정 오류로 장비 연결을 시작하지 않았습니다.\n{e}")
 
-    plc_binder = HmiPlcBinder(hmi.ui, plc_settings)
-    plc_binder.start()
-
-    app.aboutToQuit.connect(plc_binder.stop)
-    app.aboutToQuit.connect(dev_mgr.close_all)  # ✅ 추가
+    app.aboutToQuit.connect(hmi.close_devices)  # ✅ 재연결 스레드 join 후 close_all
 
     # ✅ HMI가 Config 저장 후 재연결할 수 있도록 주입
-    hmi.set_runtime_objects(plc_binder, dev_mgr, ini_path)
+    hmi.set_runtime_objects(None, dev_mgr, ini_path)
+
+    # PLC는 STM/ACS 포트 open(느리고 실패 가능)보다 먼저 시작 → 장비 쪽 문제와 무관하게 동작
+    if plc_settings is not None:
+        hmi.start_plc_binder(plc_settings)
+
+    if dev_mgr is not None:
+        dev_errors = dev_mgr.connect_all()  # 실패한 것만 dict로 옴
+        if dev_errors:
+            # 필요하면 여기서 QMessageBox로 알려도 됨(원하면)
+            pass
+
+
+def _deferred_start(app: QApplication, hmi: HmiWindow) -> None:
+    """_start_runtime용 singleShot 슬롯.
+
+    지연 실행된 슬롯의 예외는 main()까지 올라오지 않으므로, 여기서 traceback을 남기고 팝업으로 알린다.
+    """
+    try:
+        _start_runtime(app, hmi)
+    except Exception as e:
+        traceback.print_exc()
+        QMessageBox.critical(hmi, "Startup", f"초기화 중 오류가 발생했습니다.\n{e}")
+
+
+def main():
+    app = QApplication(sys.argv)
+
+    hmi = HmiWindow()
+    proc = ProcessWindow()
 
     hmi.set_process_window(proc)
     proc.set_hmi_window(hmi)
@@ -211,6 +314,9 @@ def main():
     # 이벤트 루프 시작 직후 포커싱(Windows에서도 잘 먹힘)
     QTimer.singleShot(0, _focus_hmi)
 
+    # 장비 연결/바인딩은 첫 화면이 그려진 다음에(show 때 쌓인 paint 이벤트 뒤에 실행)
+    QTimer.singleShot(0, lambda: _deferred_start(app, hmi))
+
     sys.exit(app.exec())
 
 
@@ -24,6 +24,8 @@ from PySide6.QtWidgets import (
 
 from configparser import ConfigParser
 
+from config._ini_cache import DeviceConfig
+
 
 # -----------------------------
 # ini 편집(주석 보존) 유틸
@@ -116,9 +118,11 @@ class ConfigDialog(QDialog):
         self.ini_path = Path(ini_path)
         self.on_saved = on_saved
 
-        self._cfg = ConfigParser()
+        # 읽기 전용으로만 쓰므로 plc/serial 로더와 같은 캐시를 공유
         if self.ini_path.exists():
-            self._cfg.read(self.ini_path, encoding="utf-8")
+            self._cfg = DeviceConfig.instance(self.ini_path).cfg
+        else:
+            self._cfg = ConfigParser()
 
         self._build_ui()
         self._load_into_ui()
@@ -311,6 +315,7 @@ class ConfigDialog(QDialog):
                 ed.set("acs2000", "eom", self.acs_eom.currentText())
 
             ed.save()
+            DeviceConfig.invalidate(self.ini_path)
 
             QMessageBox.information(self, "Saved", "devices.ini 저장 완료.\n(PLC는 저장 즉시 재적용 가능)")
             if self.on_saved:
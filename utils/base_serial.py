@@ -12,6 +12,11 @@ except ImportError as e:
     raise ImportError("pyserial is required. run: pip install pyserial") from e
 
 
+# ser.timeout 대입은 pyserial에서 포트 재설정(SetCommTimeouts/termios) syscall
+#  → 읽기 루프에서는 남은 시간이 현재 설정보다 이만큼 넘게 짧아졌을 때만 다시 줄인다(마감 초과 상한)
+_TIMEOUT_SLACK_S = 0.05
+
+
 @dataclass
 class TxRx:
     tx: bytes
@@ -68,6 +73,13 @@ class BaseSerialDevice:
                 # 깨끗한 시작
                 self._ser.reset_input_buffer()
                 self._ser.reset_output_buffer()
+
+                # Linux(FTDI 등 USB-serial): 드라이버 기본 16ms 폴링 → low-latency 모드(ASYNC_LOW_LATENCY)
+                #  - pyserial posix 구현의 set_low_latency_mode 사용. Windows/미지원 드라이버는 무시
+                try:
+                    self._ser.set_low_latency_mode(True)
+                except Exception:
+                    pass
             except Exception as e:
                 self._ser = None
                 raise SerialDeviceError(f"connect failed: port={self._port}, baud={self._baudrate}, err={e}") from e
@@ -101,10 +113,26 @@ class BaseSerialDevice:
         """
         with self._lock:
             ser = self._require()
-            t0 = time.time()
+            # monotonic: NTP 보정 등으로 벽시계가 튀어도 timeout이 어긋나지 않음
+            deadline = time.monotonic() + timeout_s
             buf = bytearray()
-            while len(buf) < n and (time.time() - t0) < timeout_s:
-                chunk = ser.read(n - len(buf))
-                if chunk:
-                    buf += chunk
+            old_to = ser.timeout
+            # timeout은 루프 전에 1번만 설정(이미 같으면 생략)
+            cur_to = timeout_s
+            if cur_to != old_to:
+                ser.timeout = cur_to
+            try:
+                while len(buf) < n:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # 남은 시간만큼 pyserial(C 레벨)에서 블록. 설정값이 남은 시간보다 많이 길 때만 줄임
+                    if cur_to - remaining > _TIMEOUT_SLACK_S:
+                        ser.timeout = cur_to = remaining
+                    chunk = ser.read(n - len(buf))
+                    if chunk:
+                        buf += chunk
+            finally:
+                if cur_to != old_to:
+                    ser.timeout = old_to
             return bytes(buf)
@@ -1,24 +1,29 @@
 # utils/device_manager.py
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from config.serial_config import load_settings
 from devices.stm100 import STM100
-from devices.acs2000 import ACS2000
+from devices.acs2000 import ACS2000, ACS2000Reader
 
 
 class DeviceManager:
     """
     STM100 / ACS2000 장비 객체를 들고 있다가,
     devices.ini 저장 후 즉시 close -> 재생성 -> connect 까지 처리한다.
+
+    - ACS2000 CON 스트림 reader는 압력값을 계속 쓰는 소비자가 있을 때만 start_acs_reader()로 켠다.
+      (켜져 있는 동안 query_pressure 등 단발 명령은 스트림과 섞이므로 쓰지 말 것)
     """
 
     def __init__(self, ini_path: str | Path, stm: STM100, acs: ACS2000):
         self.ini_path = Path(ini_path)
         self.stm = stm
         self.acs = acs
+        self.acs_reader: Optional[ACS2000Reader] = None
 
     @classmethod
     def from_ini(cls, ini_path: str | Path) -> "DeviceManager":
@@ -55,6 +60,13 @@ class DeviceManager:
         return cls(ini_path=ini_path, stm=stm, acs=acs)
 
     def close_all(self) -> None:
+        # 스트림 reader를 먼저 멈춰야 close 중에 read가 겹치지 않는다
+        reader, self.acs_reader = self.acs_reader, None
+        if reader is not None:
+            try:
+                reader.stop()
+            except Exception:
+                pass
         try:
             self.stm.close()
         except Exception:
@@ -70,18 +82,38 @@ class DeviceManager:
         return: {"stm100": "error msg", "acs2000": "error msg"}  # 실패한 것만 담김
         """
         errors: Dict[str, str] = {}
-        try:
-            self.stm.connect()
-        except Exception as e:
-            errors["stm100"] = str(e)
 
-        try:
-            self.acs.connect()
-        except Exception as e:
-            errors["acs2000"] = str(e)
+        # 장비별 포트 open은 서로 독립 → 스레드로 동시에 열어 대기 시간을 합이 아닌 최댓값으로
+        def _connect(name: str, dev) -> None:
+            try:
+                dev.connect()
+            except Exception as e:
+                errors[name] = str(e)
+
+        threads = [
+            threading.Thread(target=_connect, args=(name, dev), name=f"{name}-connect", daemon=True)
+            for name, dev in (("stm100", self.stm), ("acs2000", self.acs))
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
 
         return errors
 
+    def start_acs_reader(self, **kwargs) -> ACS2000Reader:
+        """ACS2000 CON 스트림 reader 시작(opt-in). 이미 돌고 있으면 그대로 반환.
+
+        압력값은 반환된 reader의 get_latest_pressure()로 lock 없이 가져간다.
+        kwargs는 ACS2000Reader(interval_a/timeout_s/retry_s/history)로 전달.
+        """
+        if self.acs_reader is None:
+            if not self.acs.is_connected:
+                raise RuntimeError("ACS2000 not connected")
+            self.acs_reader = ACS2000Reader(self.acs, **kwargs)
+            self.acs_reader.start()
+        return self.acs_reader
+
     def reconnect_all(self) -> Dict[str, str]:
         """close -> connect"""
         self.close_all()
@@ -96,7 +128,8 @@ class DeviceManager:
         if ini_path is not None:
             self.ini_path = Path(ini_path)
 
-        # 기존 연결 닫기
+        # 기존 연결 닫기(reader가 돌고 있었으면 새 장비로 다시 켠다)
+        had_reader = self.acs_reader is not None
         self.close_all()
 
         # 새 설정으로 객체 재생성
@@ -106,4 +139,7 @@ class DeviceManager:
 
         if not connect:
             return {}
-        return self.connect_all()
+        errors = self.connect_all()
+        if had_reader and "acs2000" not in errors:
+            self.start_acs_reader()
+        return errors